@@ -0,0 +1,10 @@
+"""Бенчмарки модулей с паттернами."""
+import importlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_pattern_module(pattern: str):
+    """Вернуть модуль паттерна по имени, например load_pattern_module("Proxy")"""
+    return importlib.import_module(f"patterns.{pattern.lower()}")
@@ -0,0 +1,40 @@
+"""Командная строка бенчмарков.
+
+    python -m benchmarks run [-k ШАБЛОН ...] [-r ПОВТОРОВ] [-o results.json]
+    python -m benchmarks compare base.json new.json [--threshold 0.1]
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="выполнить сценарии")
+    run_parser.add_argument("-k", dest="patterns", action="append",
+                            help="шаблон имени сценария, например 'proxy.*'")
+    run_parser.add_argument("-r", "--repeat", type=int, default=5)
+    run_parser.add_argument("-o", "--output", help="файл для результатов в JSON")
+
+    compare_parser = commands.add_parser("compare", help="сравнить два прогона")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = runner.run(args.patterns, repeat=args.repeat)
+        if args.output:
+            runner.save(report, args.output)
+        else:
+            json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        return 0
+    return 1 if runner.compare(args.base, args.new, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
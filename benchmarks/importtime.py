@@ -0,0 +1,53 @@
+"""Время холодного импорта пакета patterns.
+
+Каждый модуль импортируется в отдельном процессе с -X importtime; из отчета
+берется накопленное время импорта самого модуля (вместе с зависимостями).
+
+Запуск: python -m benchmarks.importtime [--budget-ms 30]
+Код возврата ненулевой, если какой-либо модуль не уложился в бюджет.
+"""
+import argparse
+import subprocess
+import sys
+
+from benchmarks import ROOT
+
+MODULES = ["patterns"] + [f"patterns.{name}" for name in
+                          ("adapter", "bridge", "cache", "composite", "decorator", "facade", "proxy")]
+DEFAULT_BUDGET_MS = 30.0
+
+
+def import_time_us(module: str) -> int:
+    """Накопленное время импорта модуля в микросекундах по данным -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        # Формат строки: "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise RuntimeError(f"Модуль {module} не найден в отчете -X importtime")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.importtime")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="число запусков, берется лучший результат")
+    args = parser.parse_args(argv)
+
+    over_budget = 0
+    for module in MODULES:
+        best_ms = min(import_time_us(module) for _ in range(args.repeat)) / 1000
+        status = "ok" if best_ms <= args.budget_ms else "ПРЕВЫШЕН БЮДЖЕТ"
+        over_budget += best_ms > args.budget_ms
+        print(f"{module:<22} {best_ms:>8.2f} мс  {status}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
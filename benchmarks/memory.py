@@ -0,0 +1,74 @@
+"""Память на экземпляр для массово создаваемых объектов.
+
+«До» - тот же класс без __slots__ (экземпляр получает __dict__),
+«после» - класс со __slots__ и его неизменяемый вариант.
+
+Запуск: python -m benchmarks.memory [количество]
+"""
+import gc
+import sys
+import tracemalloc
+
+from benchmarks import load_pattern_module
+
+DEFAULT_INSTANCES = 10 ** 6
+
+
+def _with_dict(cls):
+    """Подкласс без __slots__ - так выглядел класс до оптимизации"""
+    return type(f"{cls.__name__}WithDict", (cls,), {})
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Список со ссылками на экземпляры в расчет не входит
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+def _scenarios():
+    cache = load_pattern_module("Cache")
+    composite = load_pattern_module("Composite")
+    adapter = load_pattern_module("Adapter")
+    decorator = load_pattern_module("Decorator")
+
+    tree_type = cache.TreeType("Дуб", "зеленый", "грубая")
+    items = [{"name": "Телефон", "weight": 0.3, "price": 500}]
+
+    return {
+        "TreeType": (cache.TreeType, cache.FrozenTreeType, ("Дуб", "зеленый", "грубая")),
+        "Tree": (cache.Tree, cache.FrozenTree, (10, 20, 5, tree_type)),
+        "Product": (composite.Product, composite.FrozenProduct, ("Телефон", 22700)),
+        "ConcreteRoad": (adapter.ConcreteRoad, adapter.FrozenRoad, ("шоссе",)),
+        "Order": (decorator.Order, decorator.FrozenOrder, (items, 500, 80)),
+    }
+
+
+def run(count: int = DEFAULT_INSTANCES):
+    results = {}
+    for name, (cls, frozen_cls, args) in _scenarios().items():
+        dict_cls = _with_dict(cls)
+        results[name] = {
+            "dict": bytes_per_instance(lambda: dict_cls(*args), count),
+            "slots": bytes_per_instance(lambda: cls(*args), count),
+            "frozen": bytes_per_instance(lambda: frozen_cls(*args), count),
+        }
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_INSTANCES
+    print(f"Байт на экземпляр при {count} экземплярах:")
+    print(f"{'Класс':<14}{'__dict__':>10}{'__slots__':>11}{'frozen':>9}")
+    for name, sizes in run(count).items():
+        print(f"{name:<14}{sizes['dict']:>10.1f}{sizes['slots']:>11.1f}{sizes['frozen']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Запуск сценариев, сохранение результатов в JSON и сравнение прогонов."""
+import contextlib
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Зарегистрированные сценарии: имя -> (подготовка, число вызовов в одном замере)
+SCENARIOS: Dict[str, tuple] = {}
+
+
+def scenario(name: str, loops: int = 1):
+    """Зарегистрировать сценарий.
+
+    Декорируемая функция выполняет подготовку и возвращает вызываемый объект
+    без аргументов, время работы которого и измеряется.
+    """
+    def register(setup: Callable[[], Callable[[], object]]):
+        SCENARIOS[name] = (setup, loops)
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def _quiet():
+    # Демонстрационные классы много печатают - вывод в замер не входит
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def run_scenario(name: str, repeat: int = 5, warmup: int = 1) -> Dict[str, object]:
+    setup, loops = SCENARIOS[name]
+    with _quiet():
+        func = setup()
+        if func is None:
+            return {"skipped": True}
+        for _ in range(warmup):
+            func()
+        values = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            values.append((time.perf_counter() - start) / loops)
+    return {
+        "loops": loops,
+        "values": values,
+        "min": min(values),
+        "mean": statistics.fmean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0
+    }
+
+
+def run(patterns: Optional[List[str]] = None, repeat: int = 5) -> Dict[str, object]:
+    """Выполнить сценарии, имена которых подходят под шаблоны (fnmatch)"""
+    # Импорт регистрирует сценарии
+    from benchmarks import scenarios  # noqa: F401
+
+    names = [
+        name for name in SCENARIOS
+        if not patterns or any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    ]
+    results = {}
+    for name in names:
+        results[name] = run_scenario(name, repeat=repeat)
+        result = results[name]
+        if result.get("skipped"):
+            print(f"{name:<40} пропущен", file=sys.stderr)
+        else:
+            print(f"{name:<40} {result['mean'] * 1e6:>12.1f} мкс ± {result['stdev'] * 1e6:.1f}",
+                  file=sys.stderr)
+    return {
+        "metadata": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repeat": repeat
+        },
+        "results": results
+    }
+
+
+def save(report: Dict[str, object], path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def compare(base_path: str, new_path: str, threshold: float = 0.1) -> int:
+    """Сравнить два прогона по среднему времени; вернуть число регрессий"""
+    with open(base_path, encoding="utf-8") as f:
+        base = json.load(f)["results"]
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    for name in sorted(set(base) & set(new)):
+        if base[name].get("skipped") or new[name].get("skipped"):
+            continue
+        ratio = new[name]["mean"] / base[name]["mean"]
+        if ratio > 1 + threshold:
+            verdict = "медленнее"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            verdict = "быстрее"
+        else:
+            verdict = "без изменений"
+        print(f"{name:<40} x{ratio:.2f}  {verdict}")
+    return regressions
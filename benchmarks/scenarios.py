@@ -0,0 +1,258 @@
+"""Сценарии бенчмарков по модулям с паттернами."""
+import atexit
+import itertools
+import os
+import random
+import shutil
+import tempfile
+
+from benchmarks import load_pattern_module
+from benchmarks.runner import scenario
+
+# Временные файлы сценариев удаляются при выходе
+_TMP_DIR = tempfile.mkdtemp(prefix="patterns-bench-")
+atexit.register(shutil.rmtree, _TMP_DIR, ignore_errors=True)
+
+
+# --- Facade ---
+
+def _populated_facade(users: int, orders: int):
+    facade_module = load_pattern_module("Facade")
+    facade = facade_module.DatabaseFacade()
+    rng = random.Random(42)
+    facade._user_db._users = [
+        {"id": i, "name": f"Пользователь {i}", "email": f"user{i}@mail.ru"}
+        for i in range(1, users + 1)
+    ]
+    facade._order_db._orders = [
+        {"id": 100 + i, "user_id": rng.randint(1, users), "product": "Товар",
+         "amount": rng.uniform(10, 1000)}
+        for i in range(orders)
+    ]
+    return facade
+
+
+@scenario("facade.get_system_report", loops=1)
+def facade_system_report():
+    return _populated_facade(users=500, orders=5000).get_system_report
+
+
+@scenario("facade.get_user_profile", loops=100)
+def facade_user_profile():
+    facade = _populated_facade(users=500, orders=5000)
+    return lambda: facade.get_user_profile(250)
+
+
+# --- Хранилища Facade: в памяти и SQLite ---
+
+_STORAGE_USERS = 10_000
+_STORAGE_ORDERS = 50_000
+_storage_files = itertools.count()
+
+
+def _seeded_storage(engine: str):
+    facade_module = load_pattern_module("Facade")
+    rng = random.Random(42)
+    users = [(i, f"Пользователь {i}", f"user{i}@mail.ru") for i in range(1, _STORAGE_USERS + 1)]
+    orders = [(i, rng.randint(1, _STORAGE_USERS), "Товар", rng.uniform(10, 1000))
+              for i in range(1, _STORAGE_ORDERS + 1)]
+
+    if engine == "memory":
+        user_db, order_db = facade_module.UserDatabase(), facade_module.OrderDatabase()
+        user_db._users = [dict(zip(("id", "name", "email"), row)) for row in users]
+        order_db._orders = [dict(zip(("id", "user_id", "product", "amount"), row)) for row in orders]
+        return user_db, order_db
+
+    path = os.path.join(_TMP_DIR, f"storage-{next(_storage_files)}.db")
+    user_db, order_db = facade_module.SQLiteUserDatabase(path), facade_module.SQLiteOrderDatabase(path)
+    user_db.connect()
+    order_db.connect()
+    with user_db._db:
+        user_db._db.executemany("INSERT INTO users VALUES (?, ?, ?)", users)
+    with order_db._db:
+        order_db._db.executemany("INSERT INTO orders VALUES (?, ?, ?, ?)", orders)
+    return user_db, order_db
+
+
+def _register_storage_scenarios(engine: str):
+    @scenario(f"storage.{engine}.get_user_by_id", loops=1_000)
+    def get_user_by_id():
+        user_db, _ = _seeded_storage(engine)
+        ids = itertools.cycle(random.Random(1).sample(range(1, _STORAGE_USERS + 1), 1_000))
+        return lambda: user_db.get_user_by_id(next(ids))
+
+    @scenario(f"storage.{engine}.get_orders_by_user", loops=100)
+    def get_orders_by_user():
+        _, order_db = _seeded_storage(engine)
+        ids = itertools.cycle(random.Random(2).sample(range(1, _STORAGE_USERS + 1), 100))
+        return lambda: order_db.get_orders_by_user(next(ids))
+
+    @scenario(f"storage.{engine}.create_order", loops=1_000)
+    def create_order():
+        _, order_db = _seeded_storage(engine)
+        return lambda: order_db.create_order(1, "Товар", 99.99)
+
+    @scenario(f"storage.{engine}.export_orders_jsonl", loops=1)
+    def export_orders_jsonl():
+        facade_module = load_pattern_module("Facade")
+        facade = facade_module.DatabaseFacade(*_seeded_storage(engine))
+
+        def export():
+            with open(os.devnull, "w", encoding="utf-8") as devnull:
+                facade.export_orders(devnull, "jsonl")
+        return export
+
+
+for _engine in ("memory", "sqlite"):
+    _register_storage_scenarios(_engine)
+
+
+# --- Cache (Flyweight) ---
+
+_TREE_TYPES = [
+    ("Дуб", "зеленый", "грубая"),
+    ("Береза", "белый", "гладкая"),
+    ("Сосна", "темно-зеленый", "игольчатая")
+]
+
+
+@scenario("cache.plant_tree", loops=1)
+def forest_plant_tree():
+    cache = load_pattern_module("Cache")
+
+    def plant():
+        forest = cache.Forest()
+        for i in range(10_000):
+            forest.plant_tree(i, i, 5, *_TREE_TYPES[i % 3])
+    return plant
+
+
+@scenario("cache.display_forest", loops=1)
+def forest_display():
+    cache = load_pattern_module("Cache")
+    forest = cache.Forest()
+    for i in range(10_000):
+        forest.plant_tree(i, i, 5, *_TREE_TYPES[i % 3])
+    return forest.display_forest
+
+
+# --- Composite ---
+
+@scenario("composite.box_get_price_deep", loops=10)
+def box_get_price_deep():
+    composite = load_pattern_module("Composite")
+    root = box = composite.Box("Коробка 0", 1)
+    for depth in range(1, 200):
+        for i in range(10):
+            box.add(composite.Product(f"Товар {depth}.{i}", 100))
+        inner = composite.Box(f"Коробка {depth}", 1)
+        box.add(inner)
+        box = inner
+    return root.get_price
+
+
+# --- Decorator ---
+
+@scenario("decorator.stack_quote", loops=10_000)
+def decorator_stack_quote():
+    decorator = load_pattern_module("Decorator")
+    order = decorator.Order([{"name": "Ноутбук", "weight": 2.5}], 1050, 150)
+    delivery = decorator.InsuranceDecorator(
+        decorator.WeekendDeliveryDecorator(
+            decorator.ExpressDeliveryDecorator(decorator.CourierDelivery())
+        ),
+        order.total_value
+    )
+    return lambda: order.calculate_shipping_options(delivery)
+
+
+@scenario("decorator.manager_cached_quote", loops=10_000)
+def decorator_manager_cached_quote():
+    decorator = load_pattern_module("Decorator")
+    manager = decorator.DeliveryManager()
+    options = {"express": True, "weekend_delivery": True}
+    return lambda: manager.get_quote("courier", options, 2.5, 150)
+
+
+@scenario("decorator.batch_quote_100k", loops=1)
+def decorator_batch_quote():
+    decorator = load_pattern_module("Decorator")
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    rng = np.random.default_rng(42)
+    weights = rng.uniform(0, 30, 100_000)
+    distances = rng.uniform(0, 2000, 100_000)
+    values = rng.uniform(0, 5000, 100_000)
+    courier = decorator.CourierDelivery()
+    systems = [
+        courier,
+        decorator.ExpressDeliveryDecorator(courier),
+        decorator.WeekendDeliveryDecorator(decorator.ExpressDeliveryDecorator(courier))
+    ]
+    return lambda: decorator.quote_orders_batch(systems, weights, distances, values)
+
+
+# --- Proxy ---
+
+def _image_file(name: str, size: int = 64 * 1024) -> str:
+    path = os.path.join(_TMP_DIR, name)
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+    return path
+
+
+def _proxy_audit_log(proxy_module):
+    return proxy_module.AccessAuditLog(os.path.join(_TMP_DIR, "image_access.log"), batch_size=10_000)
+
+
+@scenario("proxy.display_hit", loops=100_000)
+def image_proxy_hit():
+    proxy_module = load_pattern_module("Proxy")
+    proxy = proxy_module.ImageProxy(
+        _image_file("hit.img"), cache=proxy_module.ImageCache(),
+        loader=proxy_module.MappedHighResolutionImage, audit_log=_proxy_audit_log(proxy_module)
+    )
+    proxy.display()
+    return proxy.display
+
+
+@scenario("proxy.display_miss", loops=1_000)
+def image_proxy_miss():
+    proxy_module = load_pattern_module("Proxy")
+    path = _image_file("miss.img")
+    audit_log = _proxy_audit_log(proxy_module)
+
+    def display_uncached():
+        # Новый кэш на каждый вызов - изображение загружается заново
+        proxy = proxy_module.ImageProxy(path, cache=proxy_module.ImageCache(),
+                                        loader=proxy_module.MappedHighResolutionImage,
+                                        audit_log=audit_log)
+        proxy.display()
+    return display_uncached
+
+
+# --- Bridge ---
+
+def _shop_logger(implementation):
+    bridge = load_pattern_module("Bridge")
+    logger = bridge.ShopLogger(implementation)
+    return lambda: logger.info("Заказ 4567 оплачен")
+
+
+@scenario("bridge.console_logger", loops=10_000)
+def shop_logger_console():
+    return _shop_logger(load_pattern_module("Bridge").ConsoleLogger())
+
+
+@scenario("bridge.file_logger", loops=10_000)
+def shop_logger_file():
+    bridge = load_pattern_module("Bridge")
+    return _shop_logger(bridge.FileLogger(os.path.join(_TMP_DIR, "shop.log")))
+
+
+@scenario("bridge.database_logger", loops=10_000)
+def shop_logger_database():
+    return _shop_logger(load_pattern_module("Bridge").DatabaseLogger("postgresql://localhost/shop"))
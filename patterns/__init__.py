@@ -0,0 +1,24 @@
+"""Структурные паттерны проектирования на примерах интернет-магазина.
+
+Подмодули загружаются лениво, при первом обращении к ним:
+
+    import patterns
+    proxy = patterns.proxy.ImageProxy("photo.jpg")
+
+Импорт пакета и подмодулей ничего не печатает и не создает файлов -
+демонстрации запускаются только через main() или python -m patterns.<модуль>.
+"""
+import importlib
+
+__all__ = ["adapter", "bridge", "cache", "composite", "decorator", "facade", "proxy"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        # import_module сам кладет подмодуль в атрибуты пакета
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,295 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+import sys
+import itertools
+import time
+
+# Интерфейс Транспорт
+class Transport(ABC):
+    @abstractmethod
+    def drive(self, road):
+        pass
+
+    def drive_many(self, roads):
+        """Проехать по набору дорог; наследники могут откладывать сборку строк"""
+        return [self.drive(road) for road in roads]
+
+
+# Интерфейс Дорога
+class Road(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def get_road_type(self):
+        pass
+
+
+def _intern_road_type(road_type):
+    # Интернировать можно только строки, остальные типы дорог храним как есть
+    return sys.intern(road_type) if type(road_type) is str else road_type
+
+
+# Конкретная реализация Дороги
+class ConcreteRoad(Road):
+    __slots__ = ("_road_type",)
+
+    def __init__(self, road_type):
+        # Интернируем тип: одинаковые типы дорог разделяют одну строку
+        self._road_type = _intern_road_type(road_type)
+
+    def get_road_type(self):
+        return self._road_type
+
+
+class FrozenRoad(ConcreteRoad):
+    """Неизменяемый участок дороги"""
+    __slots__ = ()
+
+    def __init__(self, road_type):
+        object.__setattr__(self, "_road_type", _intern_road_type(road_type))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} нельзя изменить")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} нельзя изменить")
+
+    def __reduce__(self):
+        # pickle и copy восстанавливают объект через __init__, а не через __setattr__
+        return type(self), (self._road_type,)
+
+
+# Набор участков для пакетной поездки
+class RoadBatch:
+    """Участки дорог с заранее извлеченными интернированными типами"""
+
+    def __init__(self, roads):
+        self.road_types = tuple(_intern_road_type(road.get_road_type()) for road in roads)
+
+    def __len__(self):
+        return len(self.road_types)
+
+
+def _road_types(roads):
+    if isinstance(roads, RoadBatch):
+        return roads.road_types
+    return RoadBatch(roads).road_types
+
+
+# Результат пакетной поездки
+class DriveLog(Sequence):
+    """Журнал поездки: строки "начало + тип дороги + конец" собираются только при чтении"""
+
+    def __init__(self, prefix, road_types, suffix=""):
+        self._prefix = prefix
+        self._road_types = road_types
+        self._suffix = suffix
+
+    def __len__(self):
+        return len(self._road_types)
+
+    def __getitem__(self, index):
+        prefix, suffix = self._prefix, self._suffix
+        if isinstance(index, slice):
+            return [f"{prefix}{road_type}{suffix}" for road_type in self._road_types[index]]
+        return f"{prefix}{self._road_types[index]}{suffix}"
+
+    def __iter__(self):
+        # Без поэлементного __getitem__ из Sequence - чтение всего журнала идет одним проходом
+        prefix, suffix = self._prefix, self._suffix
+        return (f"{prefix}{road_type}{suffix}" for road_type in self._road_types)
+
+    def __eq__(self, other):
+        if isinstance(other, DriveLog):
+            if (self._prefix, self._suffix) == (other._prefix, other._suffix):
+                return self._road_types == other._road_types
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+
+# Конкретный Транспорт - Машина
+class Car(Transport):
+    def drive(self, road):
+        return f"Машина едет по {road.get_road_type()}"
+
+    def drive_many(self, roads):
+        return DriveLog("Машина едет по ", _road_types(roads))
+
+
+# Объект, который НЕ является Транспортом
+class Donkey:
+    def eat(self):
+        return "Осёл кушает сено"
+
+    def walk(self):
+        return "Осёл идёт медленно"
+
+
+# Адаптер, который превращает Осла в Транспорт
+class Saddle(Transport):
+    def __init__(self, donkey):
+        self._donkey = donkey
+
+    def drive(self, road):
+        # Адаптируем интерфейс Осла к интерфейсу Транспорта
+        return f"Осёл с седлом движется по {road.get_road_type()} ({self._donkey.walk()})"
+
+    def drive_many(self, roads):
+        # Осёл идёт одинаково по любой дороге - спрашиваем его один раз на всю поездку
+        return DriveLog("Осёл с седлом движется по ", _road_types(roads), f" ({self._donkey.walk()})")
+
+
+# Реестр адаптеров: какой адаптер превращает объект в Транспорт
+_registry_ids = itertools.count()
+
+
+class AdapterRegistry:
+    """Сопоставляет типы объектов с адаптерами к Transport.
+
+    Адаптер для типа ищется по MRO один раз и запоминается. Созданный адаптер
+    сохраняется в __dict__ самого объекта: он живет ровно столько же, сколько
+    объект (цикл объект - адаптер собирается сборщиком мусора), и повторный
+    adapt() возвращает тот же экземпляр. Объекты без __dict__ адаптируются
+    без кэша.
+    """
+
+    def __init__(self):
+        self._adapters = {}
+        self._resolved = {}
+        # Свой ключ у каждого реестра, чтобы реестры не подменяли адаптеры друг друга
+        self._attr_name = f"_transport_adapter_{next(_registry_ids)}"
+
+    def register(self, source_type, adapter_type):
+        self._adapters[source_type] = adapter_type
+        # Регистрация могла изменить результат поиска для подклассов
+        self._resolved.clear()
+
+    def resolve(self, source_type):
+        """Найти класс адаптера для типа с учетом наследования"""
+        adapter_type = self._resolved.get(source_type)
+        if adapter_type is None:
+            for klass in source_type.__mro__:
+                if klass in self._adapters:
+                    adapter_type = self._adapters[klass]
+                    break
+            else:
+                raise TypeError(f"Нет адаптера к Transport для {source_type.__name__}")
+            self._resolved[source_type] = adapter_type
+        return adapter_type
+
+    def adapt(self, obj):
+        """Вернуть Transport для объекта, создавая адаптер только при первом обращении"""
+        attrs = getattr(obj, "__dict__", None)
+        cacheable = type(attrs) is dict  # Не __slots__ и не mappingproxy класса
+        if cacheable:
+            adapter = attrs.get(self._attr_name)
+            if adapter is not None:
+                return adapter
+        if isinstance(obj, Transport):
+            return obj
+
+        adapter = self.resolve(type(obj))(obj)
+        if cacheable:
+            attrs[self._attr_name] = adapter
+        return adapter
+
+
+transport_adapters = AdapterRegistry()
+transport_adapters.register(Donkey, Saddle)
+
+
+def as_transport(obj):
+    """Привести объект к Transport через общий реестр адаптеров"""
+    return transport_adapters.adapt(obj)
+
+
+# Диспетчер парка транспорта
+def dispatch_fleet(fleet, roads, consume=None):
+    """Провести весь парк по всем участкам.
+
+    Возвращает журналы поездок в порядке парка и статистику. Журналы ленивые,
+    поэтому пропускная способность считается только по реально собранным
+    строкам: если передан consume, каждая строка журнала передается в него и
+    время сборки входит в замер, иначе segments_per_second равно None.
+
+    Пула процессов здесь нет: работа на участок - сборка одной строки, и
+    передача результатов между процессами обходится дороже самой работы.
+    """
+    fleet = list(fleet)
+    road_batch = roads if isinstance(roads, RoadBatch) else RoadBatch(roads)
+
+    start = time.perf_counter()
+    logs = [transport.drive_many(road_batch) for transport in fleet]
+    if consume is not None:
+        for log in logs:
+            for line in log:
+                consume(line)
+    elapsed = time.perf_counter() - start
+
+    segments = len(fleet) * len(road_batch)
+    stats = {
+        "vehicles": len(fleet),
+        "segments": segments,
+        "elapsed": elapsed,
+        "segments_per_second": segments / elapsed if consume is not None and elapsed > 0 else None
+    }
+    return logs, stats
+
+
+def main():
+    # Создаем дороги
+    highway = ConcreteRoad("шоссе")
+    country_road = ConcreteRoad("проселочной дороге")
+
+    # Обычный транспорт - машина
+    car = Car()
+    print(car.drive(highway))
+
+    # Осёл без адаптера
+    donkey = Donkey()
+    print(donkey.eat())
+    # print(donkey.drive(highway))  # Это вызвало бы ошибку
+
+    # Осёл с адаптером (седлом) становится транспортом
+    donkey_with_saddle = Saddle(donkey)
+    print(donkey_with_saddle.drive(country_road))
+
+
+    # Мы можем использовать адаптированного осла везде, где ожидается Transport
+    def travel(transport: Transport, road: Road):
+        return transport.drive(road)
+
+
+    print(travel(car, highway))
+    print(travel(donkey_with_saddle, country_road))
+
+    # Реестр адаптеров: седло создается один раз на осла
+    print(travel(as_transport(donkey), highway))
+    print(as_transport(donkey) is as_transport(donkey))
+    print(travel(as_transport(car), country_road))
+
+    # Пакетная поездка: строки собираются только при чтении журнала
+    route = RoadBatch([highway, country_road, highway])
+    for line in donkey_with_saddle.drive_many(route):
+        print(line)
+
+    # Большой парк по тысячам участков; строки журнала собираются и подсчитываются
+    fleet = [Car() if i % 2 else Saddle(Donkey()) for i in range(1000)]
+    roads = [highway if i % 3 else country_road for i in range(5000)]
+    total_chars = 0
+
+    def count_chars(line):
+        nonlocal total_chars
+        total_chars += len(line)
+
+    logs, stats = dispatch_fleet(fleet, roads, consume=count_chars)
+    print(f"Парк: {stats['vehicles']} ед., участков пройдено: {stats['segments']}, "
+          f"{stats['segments_per_second']:.0f} участков/с, символов в журналах: {total_chars}")
+    print(logs[1][0])
+
+
+if __name__ == "__main__":
+    main()
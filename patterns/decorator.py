@@ -0,0 +1,729 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import heapq
+import itertools
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# NumPy нужен только для пакетного расчета и импортируется внутри функций
+def _as_float_array(values) -> "np.ndarray":
+    """Привести последовательность к массиву float для векторных расчетов"""
+    try:
+        import numpy as np
+    except ImportError as error:
+        raise ImportError("Для пакетного расчета доставки требуется NumPy") from error
+    return np.asarray(values, dtype=float)
+
+# Абстрактный класс системы доставки
+class DeliverySystem(ABC):
+    @abstractmethod
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        pass
+
+    @abstractmethod
+    def get_delivery_time(self, distance: float) -> int:
+        pass
+
+    @abstractmethod
+    def get_description(self) -> str:
+        pass
+
+    # Пакетный расчет: по умолчанию поэлементно, наследники считают векторно.
+    # values - стоимости заказов; их учитывают только декораторы, зависящие от цены товара
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        import numpy as np
+
+        weights = _as_float_array(weights)
+        distances = _as_float_array(distances)
+        return np.array([self.calculate_cost(w, d) for w, d in zip(weights, distances)], dtype=float)
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        import numpy as np
+
+        distances = _as_float_array(distances)
+        return np.array([self.get_delivery_time(d) for d in distances], dtype=int)
+
+
+# Базовые реализации систем доставки
+class CourierDelivery(DeliverySystem):
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        base_cost = 5.0  # Базовая стоимость
+        cost_per_km = 0.5
+        cost_per_kg = 1.0
+        return base_cost + (distance * cost_per_km) + (weight * cost_per_kg)
+
+    def get_delivery_time(self, distance: float) -> int:
+        # Стандартное время доставки в днях
+        return max(3, int(distance / 50))
+
+    def get_description(self) -> str:
+        return "Курьерская доставка"
+
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        weights = _as_float_array(weights)
+        distances = _as_float_array(distances)
+        return 5.0 + distances * 0.5 + weights * 1.0
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        import numpy as np
+
+        distances = _as_float_array(distances)
+        return np.maximum(3, (distances / 50).astype(int))
+
+
+class PostalDelivery(DeliverySystem):
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        base_cost = 2.0
+        cost_per_kg = 0.5
+        return base_cost + (weight * cost_per_kg)
+
+    def get_delivery_time(self, distance: float) -> int:
+        # Почта обычно медленнее
+        return max(7, int(distance / 30))
+
+    def get_description(self) -> str:
+        return "Почтовая доставка"
+
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        weights = _as_float_array(weights)
+        return 2.0 + weights * 0.5
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        import numpy as np
+
+        distances = _as_float_array(distances)
+        return np.maximum(7, (distances / 30).astype(int))
+
+
+class PickupDelivery(DeliverySystem):
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        # Самовывоз обычно бесплатный
+        return 0.0
+
+    def get_delivery_time(self, distance: float) -> int:
+        # Мгновенная выдача при самовывозе
+        return 0
+
+    def get_description(self) -> str:
+        return "Самовывоз"
+
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        import numpy as np
+
+        return np.zeros(len(_as_float_array(weights)), dtype=float)
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        import numpy as np
+
+        return np.zeros(len(_as_float_array(distances)), dtype=int)
+
+
+# Класс-потомок для экспресс-доставки (используется в декораторе)
+class ExpressDeliverySystem(DeliverySystem):
+    def __init__(self):
+        self.express_multiplier = 2.0  # Наценка за экспресс
+        self.express_time_reduction = 0.3  # Сокращение времени на 30%
+
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        # Базовая стоимость экспресс-доставки
+        base_express_cost = 10.0
+        cost_per_km = 1.0
+        return base_express_cost + (distance * cost_per_km)
+
+    def get_delivery_time(self, distance: float) -> int:
+        # Экспресс доставка всегда быстрая
+        return max(1, int(distance / 100))
+
+    def get_description(self) -> str:
+        return "Экспресс-доставка"
+
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        distances = _as_float_array(distances)
+        return 10.0 + distances * 1.0
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        import numpy as np
+
+        distances = _as_float_array(distances)
+        return np.maximum(1, (distances / 100).astype(int))
+
+    # Специфические методы для экспресс-доставки
+    def track_express_shipment(self, tracking_number: str) -> Dict[str, Any]:
+        """Заглушка для API отслеживания экспресс-доставки"""
+        # В реальной системе здесь был бы вызов API курьерской службы
+        return {
+            "tracking_number": tracking_number,
+            "status": "В пути",
+            "estimated_delivery": "Завтра",
+            "current_location": "Сортировочный центр",
+            "last_update": "2024-01-15 14:30:00"
+        }
+
+    def calculate_express_insurance(self, value: float) -> float:
+        """Расчет стоимости страховки для экспресс-доставки"""
+        return value * 0.02  # 2% от стоимости товара
+
+
+# Декоратор для добавления функциональности экспресс-доставки
+class ExpressDeliveryDecorator(DeliverySystem):
+    def __init__(self, wrapped_delivery: DeliverySystem):
+        self._wrapped_delivery = wrapped_delivery
+        self._express_system = ExpressDeliverySystem()
+
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        # Добавляем наценку за экспресс к стоимости базовой доставки
+        base_cost = self._wrapped_delivery.calculate_cost(weight, distance)
+        express_cost = self._express_system.calculate_cost(weight, distance)
+        return base_cost + express_cost * 0.5  # Комбинированная стоимость
+
+    def get_delivery_time(self, distance: float) -> int:
+        # Значительно сокращаем время доставки
+        base_time = self._wrapped_delivery.get_delivery_time(distance)
+        express_time = self._express_system.get_delivery_time(distance)
+        return min(base_time, express_time)  # Берем минимальное время
+
+    def get_description(self) -> str:
+        return f"{self._wrapped_delivery.get_description()} + Экспресс"
+
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        base_cost = self._wrapped_delivery.calculate_cost_batch(weights, distances, values)
+        express_cost = self._express_system.calculate_cost_batch(weights, distances)
+        return base_cost + express_cost * 0.5
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        import numpy as np
+
+        base_time = self._wrapped_delivery.get_delivery_time_batch(distances)
+        express_time = self._express_system.get_delivery_time_batch(distances)
+        return np.minimum(base_time, express_time)
+
+    # Новые методы, добавляемые декоратором
+    def track_shipment(self, tracking_number: str) -> Dict[str, Any]:
+        """Добавляем возможность отслеживания"""
+        return self._express_system.track_express_shipment(tracking_number)
+
+    def get_express_features(self) -> Dict[str, Any]:
+        """Получить информацию о экспресс-функциях"""
+        return {
+            "priority_handling": True,
+            "real_time_tracking": True,
+            "guaranteed_delivery": True,
+            "signature_required": True
+        }
+
+
+# Дополнительные декораторы для специальных услуг
+class InsuranceDecorator(DeliverySystem):
+    def __init__(self, wrapped_delivery: DeliverySystem, item_value: float):
+        self._wrapped_delivery = wrapped_delivery
+        self._item_value = item_value
+
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        base_cost = self._wrapped_delivery.calculate_cost(weight, distance)
+        insurance_cost = self._item_value * 0.01  # 1% страховки
+        return base_cost + insurance_cost
+
+    def get_delivery_time(self, distance: float) -> int:
+        return self._wrapped_delivery.get_delivery_time(distance)
+
+    def get_description(self) -> str:
+        return f"{self._wrapped_delivery.get_description()} + Страховка"
+
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        # Страховка считается от стоимости каждого заказа; без values - от item_value
+        base_cost = self._wrapped_delivery.calculate_cost_batch(weights, distances, values)
+        if values is None:
+            return base_cost + self._item_value * 0.01
+        return base_cost + _as_float_array(values) * 0.01
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        return self._wrapped_delivery.get_delivery_time_batch(distances)
+
+
+class WeekendDeliveryDecorator(DeliverySystem):
+    def __init__(self, wrapped_delivery: DeliverySystem):
+        self._wrapped_delivery = wrapped_delivery
+
+    def calculate_cost(self, weight: float, distance: float) -> float:
+        base_cost = self._wrapped_delivery.calculate_cost(weight, distance)
+        return base_cost + 7.0  # Доплата за доставку в выходные
+
+    def get_delivery_time(self, distance: float) -> int:
+        # Гарантируем доставку в выходные
+        base_time = self._wrapped_delivery.get_delivery_time(distance)
+        return min(base_time, 2)  # Максимум 2 дня
+
+    def get_description(self) -> str:
+        return f"{self._wrapped_delivery.get_description()} + Выходные"
+
+    def calculate_cost_batch(self, weights, distances, values=None) -> "np.ndarray":
+        base_cost = self._wrapped_delivery.calculate_cost_batch(weights, distances, values)
+        return base_cost + 7.0
+
+    def get_delivery_time_batch(self, distances) -> "np.ndarray":
+        import numpy as np
+
+        base_time = self._wrapped_delivery.get_delivery_time_batch(distances)
+        return np.minimum(base_time, 2)
+
+
+# Класс заказа для демонстрации
+class Order:
+    __slots__ = ("items", "total_value", "destination_distance", "weight")
+
+    def __init__(self, items: list, total_value: float, destination_distance: float):
+        self.items = items
+        self.total_value = total_value
+        self.destination_distance = destination_distance
+        self.weight = sum(item.get('weight', 0) for item in items)
+
+    def calculate_shipping_options(self, delivery_system: DeliverySystem) -> Dict[str, Any]:
+        cost = delivery_system.calculate_cost(self.weight, self.destination_distance)
+        return {
+            "description": delivery_system.get_description(),
+            "cost": cost,
+            "delivery_time": delivery_system.get_delivery_time(self.destination_distance),
+            "total_with_shipping": self.total_value + cost
+        }
+
+
+class FrozenOrder(Order):
+    """Неизменяемый заказ, товары хранятся кортежем"""
+    __slots__ = ()
+
+    def __init__(self, items: list, total_value: float, destination_distance: float):
+        object.__setattr__(self, "items", tuple(items))
+        object.__setattr__(self, "total_value", total_value)
+        object.__setattr__(self, "destination_distance", destination_distance)
+        object.__setattr__(self, "weight", sum(item.get('weight', 0) for item in items))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} нельзя изменить")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} нельзя изменить")
+
+    def __reduce__(self):
+        # pickle и copy восстанавливают объект через __init__, а не через __setattr__
+        return type(self), (self.items, self.total_value, self.destination_distance)
+
+
+def quote_orders_batch(delivery_systems: Sequence[DeliverySystem], weights, distances,
+                       values) -> List[Dict[str, Any]]:
+    """Рассчитать доставку сразу для массива заказов по каждому варианту доставки.
+
+    Для каждой системы доставки (в том числе обернутой декораторами) возвращает
+    массивы стоимости, сроков и итоговой суммы, посчитанные одним векторным проходом.
+    Страховка (InsuranceDecorator) берется как 1% от values каждого заказа,
+    а не от item_value, переданного декоратору.
+    """
+    weights = _as_float_array(weights)
+    distances = _as_float_array(distances)
+    values = _as_float_array(values)
+    if not (len(weights) == len(distances) == len(values)):
+        raise ValueError("Массивы весов, расстояний и стоимостей должны быть одной длины")
+
+    quotes = []
+    for delivery_system in delivery_systems:
+        cost = delivery_system.calculate_cost_batch(weights, distances, values)
+        quotes.append({
+            "description": delivery_system.get_description(),
+            "cost": cost,
+            "delivery_time": delivery_system.get_delivery_time_batch(distances),
+            "total_with_shipping": values + cost
+        })
+    return quotes
+
+
+# Демонстрация работы системы
+def main():
+    print("=== СИСТЕМА ДОСТАВКИ ИНТЕРНЕТ-МАГАЗИНА ===\n")
+
+    # Создаем тестовый заказ
+    order = Order([
+        {"name": "Ноутбук", "weight": 2.5, "price": 1000},
+        {"name": "Мышь", "weight": 0.2, "price": 50}
+    ], total_value=1050, destination_distance=150)
+
+    # Базовые варианты доставки
+    courier = CourierDelivery()
+    postal = PostalDelivery()
+    pickup = PickupDelivery()
+
+    print("БАЗОВЫЕ ВАРИАНТЫ ДОСТАВКИ:")
+    print("Курьерская:", order.calculate_shipping_options(courier))
+    print("Почтовая:", order.calculate_shipping_options(postal))
+    print("Самовывоз:", order.calculate_shipping_options(pickup))
+
+    print("\n" + "=" * 50)
+    print("ДОПОЛНИТЕЛЬНЫЕ УСЛУГИ (ДЕКОРАТОРЫ):")
+    print("=" * 50)
+
+    # Комбинируем различные варианты доставки с декораторами
+    express_courier = ExpressDeliveryDecorator(courier)
+    insured_postal = InsuranceDecorator(postal, order.total_value)
+    weekend_express = WeekendDeliveryDecorator(express_courier)
+    full_service = InsuranceDecorator(weekend_express, order.total_value)
+
+    print("Экспресс-курьер:", order.calculate_shipping_options(express_courier))
+    print("Почта со страховкой:", order.calculate_shipping_options(insured_postal))
+    print("Экспресс в выходные:", order.calculate_shipping_options(weekend_express))
+    print("Полный сервис:", order.calculate_shipping_options(full_service))
+
+    print("\n" + "=" * 50)
+    print("ФУНКЦИОНАЛ ЭКСПРЕСС-ДОСТАВКИ:")
+    print("=" * 50)
+
+    # Демонстрация специфического функционала экспресс-доставки
+    tracking_info = express_courier.track_shipment("TRACK123456")
+    print("Отслеживание отправления:", tracking_info)
+
+    express_features = express_courier.get_express_features()
+    print("Экспресс-функции:", express_features)
+
+    print("\n" + "=" * 50)
+    print("ВСЕ ВОЗМОЖНЫЕ КОМБИНАЦИИ:")
+    print("=" * 50)
+
+    # Создаем все возможные комбинации
+    delivery_options = [
+        ("Простая почта", postal),
+        ("Почта + страховка", InsuranceDecorator(postal, order.total_value)),
+        ("Курьер", courier),
+        ("Курьер + экспресс", express_courier),
+        ("Курьер + экспресс + выходные", weekend_express),
+        ("Курьер + экспресс + выходные + страховка", full_service),
+    ]
+
+    for name, option in delivery_options:
+        result = order.calculate_shipping_options(option)
+        print(f"{name}: {result}")
+
+    try:
+        # Веса, расстояния и стоимости заказов передаются массивами
+        quotes = quote_orders_batch(
+            [option for _, option in delivery_options],
+            weights=[2.7, 0.5, 12.0],
+            distances=[150, 40, 600],
+            values=[1050, 200, 3000]
+        )
+    except ImportError:
+        return  # Без NumPy пакетный расчет недоступен
+
+    print("\n" + "=" * 50)
+    print("ПАКЕТНЫЙ РАСЧЕТ ДЛЯ НЕСКОЛЬКИХ ЗАКАЗОВ:")
+    print("=" * 50)
+    for quote in quotes:
+        print(f"{quote['description']}: стоимость {quote['cost'].tolist()}, "
+              f"сроки {quote['delivery_time'].tolist()}")
+
+
+# Дополнительный класс для управления доставками
+class DeliveryManager:
+    def __init__(self, quote_cache_size: int = 1024, stack_cache_size: int = 256):
+        if quote_cache_size < 0:
+            raise ValueError(f"quote_cache_size must be >= 0, got {quote_cache_size}")
+        if stack_cache_size < 0:
+            raise ValueError(f"stack_cache_size must be >= 0, got {stack_cache_size}")
+        self.available_deliveries = {
+            "courier": CourierDelivery(),
+            "postal": PostalDelivery(),
+            "pickup": PickupDelivery()
+        }
+        # Интернированные стеки декораторов: одна цепочка на набор опций.
+        # item_value входит в ключ, поэтому таблица ограничена как LRU
+        self._stack_cache_size = stack_cache_size
+        self._delivery_stacks: "OrderedDict[Tuple, DeliverySystem]" = OrderedDict()
+        self._stacks_lock = threading.Lock()
+
+        # Ограниченный LRU-кэш расчетов стоимости
+        self._quote_cache_size = quote_cache_size
+        self._quote_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._quote_lock = threading.Lock()
+        self._quote_hits = 0
+        self._quote_misses = 0
+
+    @staticmethod
+    def _options_key(base_type: str, options: Dict[str, Any]) -> Tuple:
+        """Канонический ключ набора опций: лишние и ложные значения не влияют на ключ"""
+        insurance = bool(options.get("insurance"))
+        item_value = float(options.get("item_value", 0)) if insurance else None
+        return (
+            base_type,
+            bool(options.get("express")),
+            insurance,
+            item_value,
+            bool(options.get("weekend_delivery"))
+        )
+
+    def _build_delivery(self, base_type: str, options: Dict[str, Any]) -> DeliverySystem:
+        base_delivery = self.available_deliveries.get(base_type)
+        if not base_delivery:
+            raise ValueError(f"Unknown delivery type: {base_type}")
+
+        result = base_delivery
+
+        # Применяем декораторы в зависимости от опций
+        if options.get("express"):
+            result = ExpressDeliveryDecorator(result)
+
+        if options.get("insurance"):
+            result = InsuranceDecorator(result, options.get("item_value", 0))
+
+        if options.get("weekend_delivery"):
+            result = WeekendDeliveryDecorator(result)
+
+        return result
+
+    def create_custom_delivery(self, base_type: str, options: Dict[str, Any]) -> DeliverySystem:
+        """Создать кастомную доставку с выбранными опциями.
+
+        Декораторы не хранят изменяемого состояния, поэтому для одинакового
+        набора опций возвращается один и тот же экземпляр цепочки, пока он
+        не вытеснен из LRU последних stack_cache_size наборов.
+        """
+        key = self._options_key(base_type, options)
+        with self._stacks_lock:
+            delivery = self._delivery_stacks.get(key)
+            if delivery is not None:
+                self._delivery_stacks.move_to_end(key)
+                return delivery
+
+        # Сборка цепочки дешевая, поэтому выполняется вне блокировки
+        delivery = self._build_delivery(base_type, options)
+        with self._stacks_lock:
+            # Параллельный вызов мог успеть сохранить свою цепочку - отдаем ее
+            delivery = self._delivery_stacks.setdefault(key, delivery)
+            self._delivery_stacks.move_to_end(key)
+            while len(self._delivery_stacks) > self._stack_cache_size:
+                self._delivery_stacks.popitem(last=False)
+        return delivery
+
+    def get_quote(self, base_type: str, options: Dict[str, Any],
+                  weight: float, distance: float) -> Dict[str, Any]:
+        """Рассчитать доставку с использованием LRU-кэша"""
+        key = (self._options_key(base_type, options), float(weight), float(distance))
+
+        with self._quote_lock:
+            quote = self._quote_cache.get(key)
+            if quote is not None:
+                self._quote_cache.move_to_end(key)
+                self._quote_hits += 1
+                return dict(quote)
+            self._quote_misses += 1
+
+        # Расчет выполняется вне блокировки, повторный расчет безопасен
+        delivery = self.create_custom_delivery(base_type, options)
+        quote = {
+            "description": delivery.get_description(),
+            "cost": delivery.calculate_cost(weight, distance),
+            "delivery_time": delivery.get_delivery_time(distance)
+        }
+
+        with self._quote_lock:
+            self._quote_cache[key] = quote
+            self._quote_cache.move_to_end(key)
+            while len(self._quote_cache) > self._quote_cache_size:
+                self._quote_cache.popitem(last=False)
+        return dict(quote)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Статистика кэша расчетов"""
+        with self._quote_lock:
+            total = self._quote_hits + self._quote_misses
+            return {
+                "hits": self._quote_hits,
+                "misses": self._quote_misses,
+                "hit_rate": self._quote_hits / total if total > 0 else 0.0,
+                "size": len(self._quote_cache),
+                "max_size": self._quote_cache_size,
+                "delivery_stacks": len(self._delivery_stacks),
+                "max_delivery_stacks": self._stack_cache_size
+            }
+
+    def clear_cache(self):
+        """Очистить кэш расчетов и сбросить статистику"""
+        with self._quote_lock:
+            self._quote_cache.clear()
+            self._quote_hits = 0
+            self._quote_misses = 0
+
+
+# Полная матрица вариантов доставки: базовый тип x порядок опций x заказ
+DELIVERY_OPTIONS = ("express", "insurance", "weekend_delivery")
+
+_RANK_KEYS = {
+    "cost": lambda row: (row["cost"], row["delivery_time"]),
+    "time": lambda row: (row["delivery_time"], row["cost"])
+}
+
+
+def iter_option_sequences(options: Sequence[str] = DELIVERY_OPTIONS) -> Iterator[Tuple[str, ...]]:
+    """Все подмножества опций во всех порядках применения (включая пустое)"""
+    for size in range(len(options) + 1):
+        yield from itertools.permutations(options, size)
+
+
+def build_delivery_stack(base_delivery: DeliverySystem, option_sequence: Sequence[str],
+                         item_value: float = 0.0) -> DeliverySystem:
+    """Обернуть базовую доставку декораторами в заданном порядке"""
+    result = base_delivery
+    for option in option_sequence:
+        if option == "express":
+            result = ExpressDeliveryDecorator(result)
+        elif option == "insurance":
+            result = InsuranceDecorator(result, item_value)
+        elif option == "weekend_delivery":
+            result = WeekendDeliveryDecorator(result)
+        else:
+            raise ValueError(f"Unknown delivery option: {option}")
+    return result
+
+
+def _iter_matrix_rows(order_params: Iterable[Tuple[float, float, float]],
+                      start_index: int = 0) -> Iterator[Dict[str, Any]]:
+    """Строки матрицы для заказов, заданных кортежами (вес, расстояние, стоимость)"""
+    manager = DeliveryManager()
+    option_sequences = list(iter_option_sequences())
+
+    for order_index, (weight, distance, total_value) in enumerate(order_params, start_index):
+        for base_type, base_delivery in manager.available_deliveries.items():
+            for option_sequence in option_sequences:
+                delivery = build_delivery_stack(base_delivery, option_sequence, total_value)
+                cost = delivery.calculate_cost(weight, distance)
+                yield {
+                    "order_index": order_index,
+                    "base_type": base_type,
+                    "options": option_sequence,
+                    "description": delivery.get_description(),
+                    "cost": cost,
+                    "delivery_time": delivery.get_delivery_time(distance),
+                    "total_with_shipping": total_value + cost
+                }
+
+
+def _order_params(orders: Iterable[Order]) -> Iterator[Tuple[float, float, float]]:
+    for order in orders:
+        yield order.weight, order.destination_distance, order.total_value
+
+
+def iter_shipping_matrix(orders: Iterable[Order]) -> Iterator[Dict[str, Any]]:
+    """Потоково перебрать все комбинации доставки для каждого заказа"""
+    return _iter_matrix_rows(_order_params(orders))
+
+
+def _shipping_matrix_chunk(start_index: int, order_params: List[Tuple[float, float, float]],
+                           top_k: Optional[int], rank_by: str) -> List[Dict[str, Any]]:
+    """Обработка одной порции заказов в процессе-исполнителе"""
+    rows = _iter_matrix_rows(order_params, start_index)
+    if top_k is None:
+        return list(rows)
+    return heapq.nsmallest(top_k, rows, key=_RANK_KEYS[rank_by])
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+
+def _iter_chunk_results(orders: Iterable[Order], chunk_size: int, max_workers: Optional[int],
+                        top_k: Optional[int], rank_by: str) -> Iterator[List[Dict[str, Any]]]:
+    """Раздать заказы порциями по процессам, держа в работе ограниченное число порций"""
+    params = _order_params(orders)
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_workers * 2
+    # Пул процессов нужен только здесь - не тянем multiprocessing при импорте
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = []
+        start_index = 0
+        while True:
+            chunk = list(itertools.islice(params, chunk_size))
+            if chunk:
+                pending.append(executor.submit(
+                    _shipping_matrix_chunk, start_index, chunk, top_k, rank_by
+                ))
+                start_index += len(chunk)
+            # Выдаем результаты по порядку, как только очередь заполнена
+            while pending and (len(pending) >= max_pending or not chunk):
+                yield pending.pop(0).result()
+            if not chunk:
+                break
+
+
+def iter_shipping_matrix_parallel(orders: Iterable[Order], chunk_size: int = 1000,
+                                  max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Потоковая матрица доставки, посчитанная порциями на нескольких ядрах"""
+    # Проверяем сразу при вызове, а не при первом next()
+    _check_chunk_size(chunk_size)
+    return itertools.chain.from_iterable(
+        _iter_chunk_results(orders, chunk_size, max_workers, None, "cost")
+    )
+
+
+def top_shipping_options(orders: Iterable[Order], k: int = 10, rank_by: str = "cost",
+                         chunk_size: int = 1000,
+                         max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Топ-k самых дешевых (rank_by="cost") или быстрых (rank_by="time") вариантов"""
+    if rank_by not in _RANK_KEYS:
+        raise ValueError(f"Unknown ranking: {rank_by}")
+    if k < 1:
+        raise ValueError(f"k must be >= 1, got {k}")
+    _check_chunk_size(chunk_size)
+    key = _RANK_KEYS[rank_by]
+    best: List[Dict[str, Any]] = []
+    for rows in _iter_chunk_results(orders, chunk_size, max_workers, k, rank_by):
+        best = heapq.nsmallest(k, itertools.chain(best, rows), key=key)
+    return best
+
+
+def delivery_manager_demo():
+    # Демонстрация DeliveryManager
+    print("\n" + "=" * 50)
+    print("УПРАВЛЕНИЕ ДОСТАВКАМИ ЧЕРЕЗ MANAGER:")
+    print("=" * 50)
+
+    manager = DeliveryManager()
+    test_order = Order([{"name": "Телефон", "weight": 0.3, "price": 500}], 500, 80)
+
+    # Создаем кастомные доставки
+    fast_delivery = manager.create_custom_delivery("courier", {
+        "express": True,
+        "weekend_delivery": True
+    })
+
+    safe_delivery = manager.create_custom_delivery("postal", {
+        "insurance": True,
+        "item_value": 500
+    })
+
+    print("Быстрая доставка:", test_order.calculate_shipping_options(fast_delivery))
+    print("Безопасная доставка:", test_order.calculate_shipping_options(safe_delivery))
+
+    # Повторные расчеты с теми же параметрами берутся из кэша
+    for _ in range(3):
+        manager.get_quote("courier", {"express": True, "weekend_delivery": True}, 0.3, 80)
+    print("Статистика кэша:", manager.get_cache_stats())
+
+    print("\n" + "=" * 50)
+    print("МАТРИЦА ВСЕХ КОМБИНАЦИЙ:")
+    print("=" * 50)
+
+    orders = [test_order, Order([{"name": "Ноутбук", "weight": 2.5, "price": 1000}], 1000, 150)]
+    print("Всего вариантов:", sum(1 for _ in iter_shipping_matrix(orders)))
+    for row in top_shipping_options(orders, k=3, rank_by="cost", max_workers=2):
+        print(f"Дешевле всего: заказ {row['order_index']}, {row['description']} - {row['cost']}")
+    for row in top_shipping_options(orders, k=3, rank_by="time", max_workers=2):
+        print(f"Быстрее всего: заказ {row['order_index']}, {row['description']} - {row['delivery_time']} дн.")
+
+
+if __name__ == "__main__":
+    main()
+    delivery_manager_demo()
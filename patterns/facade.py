@@ -0,0 +1,560 @@
+from abc import ABC, abstractmethod
+import csv
+import json
+import sqlite3
+import sys
+from typing import Dict, Any, Iterator, List, Optional, TextIO
+
+# Размер порции при потоковом чтении таблиц
+DEFAULT_CHUNK_SIZE = 1000
+
+USER_FIELDS = ("id", "name", "email")
+ORDER_FIELDS = ("id", "user_id", "product", "amount")
+
+SQLITE_MIN_INTEGER = -2 ** 63
+SQLITE_MAX_INTEGER = 2 ** 63 - 1
+
+
+def _check_chunk_size(chunk_size: int):
+    if chunk_size < 1:
+        raise ValueError(f"Размер порции должен быть не меньше 1, получено: {chunk_size}")
+
+
+def _iter_chunked(rows: List[Dict[str, Any]], chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """Отдавать строки списка порциями, не копируя список целиком"""
+    _check_chunk_size(chunk_size)
+    return (row for start in range(0, len(rows), chunk_size) for row in rows[start:start + chunk_size])
+
+class UserDatabase:
+    """Сложная подсистема для работы с базой данных пользователей"""
+
+    def __init__(self):
+        self._connection = "PostgreSQL Connection - Users"
+        self._users = [
+            {"id": 1, "name": "Виктор Иосович", "email": "Victor@mail.ru"},
+            {"id": 2, "name": "Владислав Сенчилов", "email": "Senchilov@mail.ru"}
+        ]
+
+    def connect(self):
+        print(f"Подключение к базе пользователей: {self._connection}")
+        return True
+
+    def disconnect(self):
+        print("Отключение от базы пользователей")
+
+    def execute_query(self, query: str):
+        print(f"Выполнение запроса к базе пользователей: {query}")
+        # Здесь была бы реальная логика выполнения запроса
+        return f"Результат из базы пользователей: {query}"
+
+    def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
+        print(f"Поиск пользователя с ID: {user_id}")
+        for user in self._users:
+            if user["id"] == user_id:
+                return user
+        return {}
+
+    def get_all_users(self) -> List[Dict[str, Any]]:
+        print("Получение всех пользователей")
+        # Копия списка: вызывающий код не должен менять внутреннее хранилище
+        return list(self._users)
+
+    def iter_users(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        print("Потоковое чтение пользователей")
+        return _iter_chunked(self._users, chunk_size)
+
+    def create_user(self, name: str, email: str) -> Dict[str, Any]:
+        print(f"Создание пользователя: {name}, {email}")
+        new_id = max(user["id"] for user in self._users) + 1
+        new_user = {"id": new_id, "name": name, "email": email}
+        self._users.append(new_user)
+        return new_user
+
+
+class OrderDatabase:
+    """Сложная подсистема для работы с базой данных заказов"""
+
+    def __init__(self):
+        self._connection = "MongoDB Connection - Orders"
+        self._orders = [
+            {"id": 101, "user_id": 1, "product": "Ноутбук", "amount": 15975},
+            {"id": 102, "user_id": 2, "product": "Телефон", "amount": 8755}
+        ]
+
+    def connect(self):
+        print(f"Подключение к базе заказов: {self._connection}")
+        return True
+
+    def disconnect(self):
+        print("Отключение от базы заказов")
+
+    def execute_query(self, query: str):
+        print(f"Выполнение запроса к базе заказов: {query}")
+        # Здесь была бы реальная логика выполнения запроса
+        return f"Результат из базы заказов: {query}"
+
+    def get_order_by_id(self, order_id: int) -> Dict[str, Any]:
+        print(f"Поиск заказа с ID: {order_id}")
+        for order in self._orders:
+            if order["id"] == order_id:
+                return order
+        return {}
+
+    def get_orders_by_user(self, user_id: int) -> List[Dict[str, Any]]:
+        print(f"Поиск заказов пользователя с ID: {user_id}")
+        return [order for order in self._orders if order["user_id"] == user_id]
+
+    def iter_orders(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        print("Потоковое чтение заказов")
+        return _iter_chunked(self._orders, chunk_size)
+
+    def iter_orders_by_user(self, user_id: int,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        print(f"Потоковое чтение заказов пользователя с ID: {user_id}")
+        return (order for order in _iter_chunked(self._orders, chunk_size) if order["user_id"] == user_id)
+
+    def create_order(self, user_id: int, product: str, amount: float) -> Dict[str, Any]:
+        print(f"Создание заказа для пользователя {user_id}: {product}")
+        new_id = max(order["id"] for order in self._orders) + 1
+        new_order = {"id": new_id, "user_id": user_id, "product": product, "amount": amount}
+        self._orders.append(new_order)
+        return new_order
+
+
+class AnalyticsDatabase:
+    """Дополнительная сложная подсистема для аналитики"""
+
+    def __init__(self):
+        self._connection = "Elasticsearch Connection - Analytics"
+
+    def connect(self):
+        print(f"Подключение к базе аналитики: {self._connection}")
+        return True
+
+    def disconnect(self):
+        print("Отключение от базы аналитики")
+
+    def log_user_activity(self, user_id: int, action: str):
+        print(f"Логирование активности пользователя {user_id}: {action}")
+        return f"Активность записана: пользователь {user_id} - {action}"
+
+    def get_user_statistics(self, user_id: int) -> Dict[str, Any]:
+        print(f"Получение статистики для пользователя {user_id}")
+        return {
+            "user_id": user_id,
+            "total_orders": 5,  # Примерные данные
+            "total_spent": 1250.50,
+            "favorite_category": "Electronics"
+        }
+
+
+# Хранение в файле SQLite - те же методы, но данные переживают перезапуск
+# и не обязаны целиком помещаться в память
+class SQLiteDatabase:
+    """Общая часть подсистем на SQLite: подключение, WAL и схема"""
+
+    SCHEMA: List[str] = []
+
+    def __init__(self, path: str):
+        self._path = path
+        self._connection = f"SQLite Connection - {path}"
+        self._db: Optional[sqlite3.Connection] = None
+
+    def connect(self):
+        print(f"Подключение к SQLite: {self._path}")
+        if self._db is None:
+            # isolation_level=None - каждая запись фиксируется сразу;
+            # запросы с параметрами компилируются один раз и берутся из кэша sqlite3
+            self._db = sqlite3.connect(self._path, isolation_level=None, cached_statements=256)
+            self._db.row_factory = sqlite3.Row
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                self._db.execute(statement)
+        return True
+
+    def disconnect(self):
+        print(f"Отключение от SQLite: {self._path}")
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        if self._db is None:
+            self.connect()
+        return self._db.execute(sql, params)
+
+    def execute_query(self, query: str, params=()) -> List[Dict[str, Any]]:
+        """Выполнить сырой SQL и вернуть строки результата списком словарей
+
+        В отличие от демонстрационных баз, запрос действительно выполняется.
+        Значения передавайте через params с плейсхолдерами "?",
+        а не подстановкой в строку запроса.
+        """
+        print(f"Выполнение запроса к SQLite: {query}")
+        return [dict(row) for row in self._execute(query, params)]
+
+    def _iter_pages(self, sql: str, params: tuple, chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """Постраничное чтение по ключу: каждая порция - отдельный запрос "id >= следующий"
+
+        Запрос должен заканчиваться на "id >= ? ORDER BY id LIMIT ?".
+        """
+        _check_chunk_size(chunk_size)
+        return self._pages(sql, params, chunk_size)
+
+    def _pages(self, sql: str, params: tuple, chunk_size: int) -> Iterator[Dict[str, Any]]:
+        # Ключ может быть нулевым и отрицательным: первая порция начинается
+        # с минимального INTEGER SQLite, следующие - с ключа после последнего
+        next_id = SQLITE_MIN_INTEGER
+        while True:
+            rows = self._execute(sql, params + (next_id, chunk_size)).fetchall()
+            for row in rows:
+                yield dict(row)
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1]["id"]
+            if last_id == SQLITE_MAX_INTEGER:
+                return
+            next_id = last_id + 1
+
+
+class SQLiteUserDatabase(SQLiteDatabase):
+    """Пользователи в SQLite с тем же интерфейсом, что и UserDatabase"""
+
+    SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS users ("
+        "id INTEGER PRIMARY KEY, name TEXT NOT NULL, email TEXT NOT NULL)"
+    ]
+
+    def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
+        print(f"Поиск пользователя с ID: {user_id}")
+        row = self._execute("SELECT id, name, email FROM users WHERE id = ?", (user_id,)).fetchone()
+        return dict(row) if row is not None else {}
+
+    def get_all_users(self) -> List[Dict[str, Any]]:
+        print("Получение всех пользователей")
+        return [dict(row) for row in self._execute("SELECT id, name, email FROM users ORDER BY id")]
+
+    def iter_users(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        print("Потоковое чтение пользователей")
+        return self._iter_pages(
+            "SELECT id, name, email FROM users WHERE id >= ? ORDER BY id LIMIT ?", (), chunk_size
+        )
+
+    def create_user(self, name: str, email: str) -> Dict[str, Any]:
+        print(f"Создание пользователя: {name}, {email}")
+        cursor = self._execute("INSERT INTO users (name, email) VALUES (?, ?)", (name, email))
+        return {"id": cursor.lastrowid, "name": name, "email": email}
+
+
+class SQLiteOrderDatabase(SQLiteDatabase):
+    """Заказы в SQLite с тем же интерфейсом, что и OrderDatabase"""
+
+    SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS orders ("
+        "id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, product TEXT NOT NULL, amount REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS idx_orders_user_id ON orders (user_id)"
+    ]
+
+    def get_order_by_id(self, order_id: int) -> Dict[str, Any]:
+        print(f"Поиск заказа с ID: {order_id}")
+        row = self._execute(
+            "SELECT id, user_id, product, amount FROM orders WHERE id = ?", (order_id,)
+        ).fetchone()
+        return dict(row) if row is not None else {}
+
+    def get_orders_by_user(self, user_id: int) -> List[Dict[str, Any]]:
+        print(f"Поиск заказов пользователя с ID: {user_id}")
+        return [dict(row) for row in self._execute(
+            "SELECT id, user_id, product, amount FROM orders WHERE user_id = ? ORDER BY id", (user_id,)
+        )]
+
+    def iter_orders(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        print("Потоковое чтение заказов")
+        return self._iter_pages(
+            "SELECT id, user_id, product, amount FROM orders WHERE id >= ? ORDER BY id LIMIT ?",
+            (), chunk_size
+        )
+
+    def iter_orders_by_user(self, user_id: int,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        print(f"Потоковое чтение заказов пользователя с ID: {user_id}")
+        return self._iter_pages(
+            "SELECT id, user_id, product, amount FROM orders "
+            "WHERE user_id = ? AND id >= ? ORDER BY id LIMIT ?",
+            (user_id,), chunk_size
+        )
+
+    def create_order(self, user_id: int, product: str, amount: float) -> Dict[str, Any]:
+        print(f"Создание заказа для пользователя {user_id}: {product}")
+        cursor = self._execute(
+            "INSERT INTO orders (user_id, product, amount) VALUES (?, ?, ?)", (user_id, product, amount)
+        )
+        return {"id": cursor.lastrowid, "user_id": user_id, "product": product, "amount": amount}
+
+
+# Фасад - единый интерфейс для работы со всеми базами данных
+class DatabaseFacade:
+    """
+    Фасад, скрывающий сложность работы с несколькими базами данных
+    и предоставляющий простой единый интерфейс
+    """
+
+    def __init__(self, user_db=None, order_db=None, analytics_db=None):
+        # По умолчанию данные в памяти; можно подставить, например, SQLite-хранилища
+        self._user_db = user_db if user_db is not None else UserDatabase()
+        self._order_db = order_db if order_db is not None else OrderDatabase()
+        self._analytics_db = analytics_db if analytics_db is not None else AnalyticsDatabase()
+
+        # Автоматическое подключение ко всем базам при инициализации
+        self._initialize_connections()
+
+    def _initialize_connections(self):
+        print("Инициализация подключений к базам данных...")
+        self._user_db.connect()
+        self._order_db.connect()
+        self._analytics_db.connect()
+        print("Все подключения установлены\n")
+
+    def close_connections(self):
+        print("Закрытие подключений к базам данных...")
+        self._user_db.disconnect()
+        self._order_db.disconnect()
+        self._analytics_db.disconnect()
+        print("Все подключения закрыты")
+
+    # Упрощенные методы для клиентского кода
+
+    def get_user_profile(self, user_id: int) -> Dict[str, Any]:
+        """Получить полный профиль пользователя с заказами и статистикой"""
+        print(f"Получение полного профиля пользователя {user_id}")
+
+        # Работа с разными базами скрыта внутри фасада
+        user = self._user_db.get_user_by_id(user_id)
+        orders = self._order_db.get_orders_by_user(user_id)
+        statistics = self._analytics_db.get_user_statistics(user_id)
+
+        return {
+            "user_info": user,
+            "orders": orders,
+            "statistics": statistics
+        }
+
+    def create_user_order(self, user_id: int, product: str, amount: float) -> Dict[str, Any]:
+        """Создать заказ для пользователя с полной логикой"""
+        print(f"Создание заказа для пользователя {user_id}")
+
+        # Проверяем существование пользователя
+        user = self._user_db.get_user_by_id(user_id)
+        if not user:
+            raise ValueError(f"Пользователь с ID {user_id} не найден")
+
+        # Создаем заказ
+        order = self._order_db.create_order(user_id, product, amount)
+
+        # Логируем активность
+        self._analytics_db.log_user_activity(user_id, f"Создан заказ {order['id']}")
+
+        return {
+            "success": True,
+            "order": order,
+            "user": user
+        }
+
+    def register_new_user(self, name: str, email: str) -> Dict[str, Any]:
+        """Зарегистрировать нового пользователя"""
+        print(f"Регистрация нового пользователя: {name}")
+
+        user = self._user_db.create_user(name, email)
+        self._analytics_db.log_user_activity(user["id"], "Регистрация")
+
+        return {
+            "success": True,
+            "user": user,
+            "message": f"Пользователь {name} успешно зарегистрирован"
+        }
+
+    def get_system_report(self) -> Dict[str, Any]:
+        """Получить системный отчет из всех баз данных"""
+        print("Формирование системного отчета...")
+
+        # Пользователи читаются потоково, а не одним списком
+        total_users = 0
+
+        # Собираем информацию о заказах
+        total_orders = 0
+        total_revenue = 0.0
+
+        for user in self._user_db.iter_users():
+            total_users += 1
+            user_orders = self._order_db.get_orders_by_user(user["id"])
+            total_orders += len(user_orders)
+            total_revenue += sum(order["amount"] for order in user_orders)
+
+        return {
+            "total_users": total_users,
+            "total_orders": total_orders,
+            "total_revenue": total_revenue,
+            "average_order_value": total_revenue / total_orders if total_orders > 0 else 0
+        }
+
+    # Потоковый доступ к таблицам и выгрузка без загрузки всей таблицы в память
+
+    def iter_users(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        return self._user_db.iter_users(chunk_size)
+
+    def iter_orders(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        return self._order_db.iter_orders(chunk_size)
+
+    def iter_user_orders(self, user_id: int,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        return self._order_db.iter_orders_by_user(user_id, chunk_size)
+
+    def export_users(self, file: TextIO, fmt: str = "csv",
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Выгрузить пользователей в CSV или JSONL; возвращает число строк"""
+        return _export_rows(self._user_db.iter_users(chunk_size), USER_FIELDS, file, fmt)
+
+    def export_orders(self, file: TextIO, fmt: str = "csv",
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Выгрузить заказы в CSV или JSONL; возвращает число строк"""
+        return _export_rows(self._order_db.iter_orders(chunk_size), ORDER_FIELDS, file, fmt)
+
+
+def _export_rows(rows: Iterator[Dict[str, Any]], fields, file: TextIO, fmt: str) -> int:
+    """Записывать строки по одной: память не зависит от размера таблицы"""
+    if fmt == "csv":
+        writer = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        write = writer.writerow
+    elif fmt == "jsonl":
+        def write(row):
+            file.write(json.dumps(row, ensure_ascii=False))
+            file.write("\n")
+    else:
+        raise ValueError(f"Неизвестный формат выгрузки: {fmt}")
+
+    count = 0
+    for row in rows:
+        write(row)
+        count += 1
+    return count
+
+
+# Клиентский код, который использует фасад
+def main():
+    # Клиент работает только с фасадом, не зная о сложной системе
+    db_facade = DatabaseFacade()
+
+    try:
+        print("=== ДЕМОНСТРАЦИЯ РАБОТЫ ФАСАДА ===\n")
+
+        # 1. Получение профиля пользователя
+        print("1. Получение профиля пользователя:")
+        profile = db_facade.get_user_profile(1)
+        print(f"Профиль: {profile}\n")
+
+        # 2. Создание нового заказа
+        print("2. Создание нового заказа:")
+        new_order = db_facade.create_user_order(2, "Ноутбук", 299.99)
+        print(f"Новый заказ: {new_order}\n")
+
+        # 3. Регистрация нового пользователя
+        print("3. Регистрация нового пользователя:")
+        new_user = db_facade.register_new_user("Алексей Жарков", "Jarkov@mail.ru")
+        print(f"Новый пользователь: {new_user}\n")
+
+        # 4. Получение системного отчета
+        print("4. Системный отчет:")
+        report = db_facade.get_system_report()
+        for key, value in report.items():
+            print(f"  {key}: {value}")
+        print()
+
+        # 5. Создание заказа для нового пользователя
+        print("5. Создание заказа для нового пользователя:")
+        order_for_new_user = db_facade.create_user_order(3, "Наушники", 99.99)
+        print(f"Заказ: {order_for_new_user}\n")
+
+        # 6. Потоковая выгрузка таблиц
+        print("6. Выгрузка пользователей (CSV) и заказов (JSONL):")
+        db_facade.export_users(sys.stdout, "csv")
+        db_facade.export_orders(sys.stdout, "jsonl")
+        print()
+
+    finally:
+        # Всегда закрываем соединения
+        db_facade.close_connections()
+
+
+# Альтернативное использование - специализированные фасады
+class ReadOnlyDatabaseFacade:
+    """Специализированный фасад только для операций чтения"""
+
+    def __init__(self, user_db=None, order_db=None, analytics_db=None):
+        self._user_db = user_db if user_db is not None else UserDatabase()
+        self._order_db = order_db if order_db is not None else OrderDatabase()
+        self._analytics_db = analytics_db if analytics_db is not None else AnalyticsDatabase()
+        self._initialize_connections()
+
+    def _initialize_connections(self):
+        self._user_db.connect()
+        self._order_db.connect()
+        self._analytics_db.connect()
+
+    def get_user_data(self, user_id: int):
+        user = self._user_db.get_user_by_id(user_id)
+        orders = self._order_db.get_orders_by_user(user_id)
+        stats = self._analytics_db.get_user_statistics(user_id)
+        return {"user": user, "orders": orders, "stats": stats}
+
+    def close(self):
+        self._user_db.disconnect()
+        self._order_db.disconnect()
+        self._analytics_db.disconnect()
+
+
+def read_only_facade_demo():
+    print("\n" + "=" * 50)
+    print("ДЕМОНСТРАЦИЯ СПЕЦИАЛИЗИРОВАННОГО ФАСАДА")
+    print("=" * 50)
+
+    # Использование специализированного фасада
+    read_only_facade = ReadOnlyDatabaseFacade()
+    try:
+        user_data = read_only_facade.get_user_data(1)
+        print(f"Данные пользователя (только чтение): {user_data}")
+    finally:
+        read_only_facade.close()
+
+
+def sqlite_facade_demo():
+    import os
+    import tempfile
+
+    print("\n" + "=" * 50)
+    print("ФАСАД НАД ХРАНИЛИЩЕМ SQLITE")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "shop.db")
+
+        db_facade = DatabaseFacade(SQLiteUserDatabase(path), SQLiteOrderDatabase(path))
+        try:
+            user = db_facade.register_new_user("Алексей Жарков", "Jarkov@mail.ru")["user"]
+            db_facade.create_user_order(user["id"], "Наушники", 99.99)
+        finally:
+            db_facade.close_connections()
+
+        # После переподключения данные на месте
+        db_facade = DatabaseFacade(SQLiteUserDatabase(path), SQLiteOrderDatabase(path))
+        try:
+            print(f"Профиль после перезапуска: {db_facade.get_user_profile(user['id'])}")
+        finally:
+            db_facade.close_connections()
+
+
+if __name__ == "__main__":
+    main()
+    read_only_facade_demo()
+    sqlite_facade_demo()
@@ -0,0 +1,576 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+import atexit
+from datetime import datetime
+import mmap
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+# Интерфейс сервиса изображений (аналог IImage в .NET)
+class IImageService(ABC):
+    @abstractmethod
+    def display(self) -> str:
+        pass
+
+# Реальный сервис загрузки изображений
+class HighResolutionImage(IImageService):
+    def __init__(self, filename: str):
+        self._filename = filename
+        self._display_text = f"Отображение высококачественного изображения: {filename}"
+        self._load_image_from_disk()
+
+    def _load_image_from_disk(self):
+        print(f"Загрузка высококачественного изображения {self._filename}...")
+        time.sleep(3)  # Имитация долгой загрузки
+        self.size_bytes = os.path.getsize(self._filename) if os.path.isfile(self._filename) else 0
+        print("Изображение загружено!")
+
+    def display(self) -> str:
+        return self._display_text
+
+
+# Реальная загрузка файла через отображение в память
+class MappedHighResolutionImage(HighResolutionImage):
+    """Изображение, отображенное в память (mmap).
+
+    Файл не копируется в bytes: заголовок и тайлы отдаются как срезы memoryview,
+    а страницы читаются с диска по требованию и разделяются всеми, кто
+    отображает тот же файл.
+    """
+
+    HEADER_SIZE = 64
+
+    def _load_image_from_disk(self):
+        with open(self._filename, "rb") as f:
+            self.size_bytes = os.fstat(f.fileno()).st_size
+            # Пустой файл нельзя отобразить в память
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size_bytes else None
+        self._buffer = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+
+    @property
+    def data(self) -> memoryview:
+        return self._buffer
+
+    def header(self, size: int = HEADER_SIZE) -> memoryview:
+        return self._buffer[:size]
+
+    def tile(self, index: int, tile_size: int) -> memoryview:
+        start = index * tile_size
+        if index < 0 or start >= self.size_bytes:
+            raise IndexError(f"Тайл {index} вне изображения {self._filename}")
+        return self._buffer[start:start + tile_size]
+
+    def tile_count(self, tile_size: int) -> int:
+        return (self.size_bytes + tile_size - 1) // tile_size
+
+    def close(self):
+        """Освободить отображение; срезы, выданные ранее, должны быть освобождены.
+
+        Если какой-то срез еще жив, mmap.close() бросает BufferError - тогда
+        буфер восстанавливается и изображение остается пригодным к работе.
+        """
+        self._buffer.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                self._buffer = memoryview(self._mmap)
+                raise
+            self._mmap = None
+
+
+def _current_rss_bytes() -> int:
+    """Текущий RSS процесса (Linux), иначе пиковый RSS"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def benchmark_image_loading(path: Optional[str] = None, size_mb: int = 256,
+                            tile_size: int = 256 * 1024) -> Dict[str, Dict[str, float]]:
+    """Сравнить полное чтение файла в bytes и отображение в память.
+
+    Для каждого способа измеряется время загрузки с чтением заголовка и одного
+    тайла и прирост RSS. Если путь не задан, создается временный файл size_mb МБ.
+    """
+    import tempfile
+
+    created = path is None
+    if created:
+        fd, path = tempfile.mkstemp(suffix=".img")
+        with os.fdopen(fd, "wb") as f:
+            chunk = os.urandom(1024 * 1024)
+            for _ in range(size_mb):
+                f.write(chunk)
+
+    results = {}
+    try:
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            data = f.read()
+        header, tile = bytes(data[:MappedHighResolutionImage.HEADER_SIZE]), data[tile_size:2 * tile_size]
+        results["read"] = {
+            "load_time": time.perf_counter() - start,
+            "rss_delta_bytes": _current_rss_bytes() - rss_before
+        }
+        del data, header, tile
+
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+        image = MappedHighResolutionImage(path)
+        header, tile = image.header(), image.tile(1, tile_size)
+        bytes(header), bytes(tile)
+        results["mmap"] = {
+            "load_time": time.perf_counter() - start,
+            "rss_delta_bytes": _current_rss_bytes() - rss_before
+        }
+        header.release()
+        tile.release()
+        image.close()
+    finally:
+        if created:
+            os.remove(path)
+    return results
+
+def benchmark_cached_display(views: int = 1_000_000) -> Dict[str, float]:
+    """Микробенчмарк повторных display() для уже загруженного изображения.
+
+    Для сравнения замеряется такое же число обращений к обычному словарю.
+    """
+    import tempfile
+
+    fd, path = tempfile.mkstemp(suffix=".img")
+    audit_path = path + ".log"
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(os.urandom(4096))
+        cache = ImageCache()
+        audit_log = AccessAuditLog(audit_path, batch_size=10_000)
+        proxy = ImageProxy(path, "User", cache=cache, loader=MappedHighResolutionImage,
+                           audit_log=audit_log)
+        proxy.display()  # Первая загрузка в замер не входит
+
+        display = proxy.display
+        start = time.perf_counter()
+        for _ in range(views):
+            display()
+        display_time = time.perf_counter() - start
+
+        table = {path: proxy}
+        start = time.perf_counter()
+        for _ in range(views):
+            table.get(path)
+        lookup_time = time.perf_counter() - start
+
+        audit_log.close()
+        cache.clear()
+    finally:
+        os.remove(path)
+        if os.path.exists(audit_path):
+            os.remove(audit_path)
+    return {
+        "views": views,
+        "display_time": display_time,
+        "ns_per_display": display_time / views * 1e9,
+        "ns_per_dict_lookup": lookup_time / views * 1e9
+    }
+
+# Общий кэш изображений для всех прокси процесса
+class ImageCache:
+    """LRU-кэш загруженных изображений с ограничением по количеству или размеру.
+
+    Одновременные запросы одного и того же файла дожидаются единственной загрузки.
+    """
+
+    def __init__(self, max_items: Optional[int] = 64, max_bytes: Optional[int] = None):
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._images: "OrderedDict[str, IImageService]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._loading: Dict[str, "Future"] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._shared_loads = 0
+        self._evictions = 0
+        self._load_time = 0.0
+
+    def contains(self, filename: str) -> bool:
+        """Проверить наличие изображения, не меняя статистику и порядок LRU"""
+        with self._lock:
+            return filename in self._images
+
+    def get(self, filename: str) -> Optional[IImageService]:
+        """Вернуть изображение из кэша, не загружая его"""
+        # Попадание обслуживается без блокировки: в CPython get и move_to_end
+        # у OrderedDict атомарны под GIL. Счетчик попаданий поэтому приблизительный
+        images = self._images
+        image = images.get(filename)
+        if image is not None:
+            try:
+                images.move_to_end(filename)
+            except KeyError:
+                pass  # Изображение только что вытеснено другим потоком
+            self._hits += 1
+        return image
+
+    def get_or_load(self, filename: str,
+                    loader: Callable[[str], IImageService]) -> IImageService:
+        """Вернуть изображение из кэша или загрузить его ровно один раз"""
+        # Быстрый путь попадания повторяет get() без лишнего вызова
+        images = self._images
+        image = images.get(filename)
+        if image is not None:
+            try:
+                images.move_to_end(filename)
+            except KeyError:
+                pass
+            self._hits += 1
+            return image
+
+        with self._lock:
+            image = self._images.get(filename)
+            if image is not None:
+                self._images.move_to_end(filename)
+                self._hits += 1
+                return image
+
+            future = self._loading.get(filename)
+            is_loader = future is None
+            if is_loader:
+                self._misses += 1
+                # concurrent.futures тянет logging - импортируем при первом промахе
+                from concurrent.futures import Future
+
+                future = Future()
+                self._loading[filename] = future
+            else:
+                self._shared_loads += 1
+
+        # Файл уже загружается другим потоком - ждем его результата
+        if not is_loader:
+            return future.result()
+
+        start = time.perf_counter()
+        try:
+            image = loader(filename)
+        except BaseException as error:
+            with self._lock:
+                del self._loading[filename]
+            future.set_exception(error)
+            raise
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            del self._loading[filename]
+            self._load_time += elapsed
+            self._store(filename, image)
+        future.set_result(image)
+        return image
+
+    def _store(self, filename: str, image: IImageService):
+        size = getattr(image, "size_bytes", 0)
+        self._images[filename] = image
+        self._sizes[filename] = size
+        self._total_bytes += size
+
+        # Вытесняем давно не используемые, но самое новое оставляем всегда
+        while len(self._images) > 1 and (
+            (self._max_items is not None and len(self._images) > self._max_items)
+            or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+        ):
+            evicted, _ = self._images.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(evicted)
+            self._evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Метрики кэша: попадания, промахи и время загрузки"""
+        with self._lock:
+            requests = self._hits + self._misses + self._shared_loads
+            loads = self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "shared_loads": self._shared_loads,
+                "hit_rate": self._hits / requests if requests > 0 else 0.0,
+                "evictions": self._evictions,
+                "items": len(self._images),
+                "bytes": self._total_bytes,
+                "total_load_time": self._load_time,
+                "average_load_time": self._load_time / loads if loads > 0 else 0.0
+            }
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+
+image_cache = ImageCache()
+
+
+# Фоновая предзагрузка изображений в общий кэш
+class ImagePrefetcher:
+    """Прогревает кэш на ограниченном пуле потоков.
+
+    Отмена снимает еще не начатые загрузки; уже идущая загрузка завершится
+    и попадет в кэш.
+    """
+
+    def __init__(self, cache: Optional[ImageCache] = None, max_workers: int = 4,
+                 loader: Callable[[str], IImageService] = HighResolutionImage):
+        self._cache = cache if cache is not None else image_cache
+        self._loader = loader
+        self._max_workers = max_workers
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._pending: Dict[str, "Future"] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> "ThreadPoolExecutor":
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                thread_name_prefix="image-prefetch")
+        return self._executor
+
+    def prefetch(self, filenames: Iterable[str]) -> Dict[str, "Future"]:
+        """Поставить файлы в очередь загрузки, уже загруженные пропускаются"""
+        scheduled = {}
+        submitted = []
+        with self._lock:
+            for filename in filenames:
+                if self._cache.contains(filename):
+                    continue
+                future = self._pending.get(filename)
+                if future is None or future.done():
+                    future = self._get_executor().submit(
+                        self._cache.get_or_load, filename, self._loader
+                    )
+                    self._pending[filename] = future
+                    submitted.append((filename, future))
+                scheduled[filename] = future
+
+        # Колбэк уже завершенной загрузки выполняется сразу в этом потоке,
+        # а _forget берет ту же блокировку - поэтому регистрируем вне ее
+        for filename, future in submitted:
+            future.add_done_callback(lambda done, name=filename: self._forget(name, done))
+        return scheduled
+
+    def _forget(self, filename: str, future: "Future"):
+        with self._lock:
+            if self._pending.get(filename) is future:
+                del self._pending[filename]
+
+    def cancel(self, filenames: Optional[Iterable[str]] = None) -> int:
+        """Отменить ожидающие загрузки (все или для указанных файлов)"""
+        with self._lock:
+            targets = list(self._pending) if filenames is None else list(filenames)
+            futures = [self._pending[name] for name in targets if name in self._pending]
+        return sum(1 for future in futures if future.cancel())
+
+    def shutdown(self, wait: bool = True):
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+_default_prefetcher: Optional[ImagePrefetcher] = None
+
+
+def prefetch(filenames: Iterable[str]) -> Dict[str, "Future"]:
+    """Заранее загрузить изображения (например, следующую страницу галереи)"""
+    global _default_prefetcher
+    if _default_prefetcher is None:
+        _default_prefetcher = ImagePrefetcher()
+    return _default_prefetcher.prefetch(filenames)
+
+
+# Таблица прав ролей: проверка доступа сводится к поиску в словаре
+ROLE_PERMISSIONS: Dict[str, FrozenSet[str]] = {
+    "Admin": frozenset({"view"}),
+    "User": frozenset({"view"})
+}
+
+
+# Журнал доступа с пакетной записью
+_now = time.time
+
+
+class AccessAuditLog:
+    """Копит события доступа в памяти и дописывает их в файл пачками.
+
+    Неполная пачка дописывается при выходе из процесса.
+    """
+
+    def __init__(self, filename: str = "image_access.log", batch_size: int = 1000):
+        self.filename = filename
+        self._batch_size = batch_size
+        # deque.append атомарен: запись идет без блокировки, а flush
+        # забирает события из той же очереди и ничего не теряет
+        self._events: "deque[Tuple[float, Tuple[str, str]]]" = deque()
+        self._file = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def record(self, user_role: str, image_filename: str):
+        self.record_key((user_role, image_filename))
+
+    def record_key(self, key: Tuple[str, str]):
+        """Записать событие по заранее собранному ключу (роль, файл) - быстрый путь прокси"""
+        events = self._events
+        events.append((_now(), key))
+        if len(events) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            queue = self._events
+            # Забираем только уже добавленные события, новые дождутся следующей пачки
+            popleft = queue.popleft
+            events = [popleft() for _ in range(len(queue))]
+            if not events:
+                return
+            if self._file is None:
+                # Файл открывается при первой записи, чтобы импорт модуля ничего не создавал
+                self._file = open(self.filename, "a", encoding="utf-8", buffering=1024 * 1024)
+            # Строка зависит только от секунды и ключа: подряд идущие просмотры
+            # одного изображения в ту же секунду форматируются один раз
+            lines = []
+            append = lines.append
+            last_second = last_key = None
+            line = ""
+            for timestamp, key in events:
+                second = int(timestamp)
+                if second != last_second or key is not last_key:
+                    last_second, last_key = second, key
+                    stamp = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+                    line = f"[{stamp}] [ACCESS] {key[0]} -> {key[1]}\n"
+                append(line)
+            self._file.write("".join(lines))
+            self._file.flush()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+access_audit_log = AccessAuditLog()
+
+
+# Proxy для ленивой загрузки и контроля доступа
+class ImageProxy(IImageService):
+    def __init__(self, filename: str, user_role: str = "User",
+                 cache: Optional[ImageCache] = None,
+                 loader: Callable[[str], IImageService] = HighResolutionImage,
+                 audit_log: Optional[AccessAuditLog] = None):
+        self._filename = filename
+        self._user_role = user_role
+        self._can_view = "view" in ROLE_PERMISSIONS.get(user_role, ())
+        self._cache = cache if cache is not None else image_cache
+        self._loader = loader
+        self._audit_log = audit_log if audit_log is not None else access_audit_log
+        self._audit_key = (user_role, filename)
+
+    def _check_access(self):
+        # Проверка прав доступа
+        if not self._can_view:
+            raise PermissionError("Недостаточно прав для просмотра изображения")
+
+    def display(self) -> str:
+        self._check_access()
+
+        # Ленивая загрузка через общий кэш; изображениями владеет только кэш
+        real_image = self._cache.get_or_load(self._filename, self._loader)
+
+        # Запись в журнал доступа попадает в файл пачками
+        self._audit_log.record_key(self._audit_key)
+
+        return real_image.display()
+
+    async def display_async(self) -> str:
+        """Асинхронный display: загрузка с диска не блокирует цикл событий"""
+        import asyncio
+
+        self._check_access()
+        if not self._cache.contains(self._filename):
+            await asyncio.to_thread(self._cache.get_or_load, self._filename, self._loader)
+        return self.display()
+
+
+def main():
+    import asyncio
+
+    print("=== ДЕМОНСТРАЦИЯ PATTERN PROXY ===\n")
+
+    # Создаем прокси (изображение НЕ загружается сразу)
+    print("1. Создание ImageProxy...")
+    image_proxy = ImageProxy("photo.jpg", "User")
+
+    print("\n2. Первый вызов display() - происходит загрузка:")
+    result1 = image_proxy.display()
+    print(f"Результат: {result1}")
+
+    print("\n3. Второй вызов display() - используется кэш:")
+    result2 = image_proxy.display()
+    print(f"Результат: {result2}")
+
+    print("\n3.1. Другой прокси для того же файла - загрузки нет:")
+    other_proxy = ImageProxy("photo.jpg", "Admin")
+    print(f"Результат: {other_proxy.display()}")
+    print(f"Статистика кэша: {image_cache.get_stats()}")
+
+    print("\n4. Попытка доступа без прав:")
+    try:
+        bad_proxy = ImageProxy("secret.jpg", "Guest")
+        bad_proxy.display()
+    except PermissionError as e:
+        print(f"Ошибка: {e}")
+
+    print("\n5. Предзагрузка следующей страницы галереи:")
+    gallery_page = ["gallery_1.jpg", "gallery_2.jpg"]
+    for future in prefetch(gallery_page).values():
+        future.result()  # В реальном приложении пользователь в это время смотрит текущую страницу
+    start = time.perf_counter()
+    for filename in gallery_page:
+        print(f"Результат: {ImageProxy(filename).display()}")
+    print(f"Время показа страницы после предзагрузки: {time.perf_counter() - start:.4f} c")
+
+    print("\n6. Асинхронный display():")
+    print(f"Результат: {asyncio.run(ImageProxy('photo.jpg').display_async())}")
+
+    access_audit_log.flush()
+    print(f"\n[PROXY] События доступа записаны в {access_audit_log.filename}")
+
+
+def benchmark_main():
+    for method, stats in benchmark_image_loading().items():
+        print(f"{method}: загрузка {stats['load_time']:.4f} c, "
+              f"прирост RSS {stats['rss_delta_bytes'] / 1024 / 1024:.1f} МБ")
+    stats = benchmark_cached_display()
+    print(f"display() из кэша: {stats['ns_per_display']:.0f} нс, "
+          f"поиск в словаре: {stats['ns_per_dict_lookup']:.0f} нс")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_main()
+    else:
+        main()
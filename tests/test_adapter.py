@@ -0,0 +1,78 @@
+import gc
+import weakref
+
+from patterns.adapter import AdapterRegistry, Car, ConcreteRoad, Donkey, Saddle, as_transport
+
+
+def test_adapter_keeps_temporary_object_alive():
+    transport = as_transport(Donkey())
+    gc.collect()
+    assert transport.drive(ConcreteRoad("шоссе")).startswith("Осёл с седлом движется по шоссе")
+
+
+def test_adapter_is_reused_while_in_use():
+    donkey = Donkey()
+    assert as_transport(donkey) is as_transport(donkey)
+    car = Car()
+    assert as_transport(car) is car
+
+
+def test_cache_does_not_keep_objects_alive():
+    registry = AdapterRegistry()
+    registry.register(Donkey, Saddle)
+    donkey = Donkey()
+    registry.adapt(donkey)
+    donkey_ref = weakref.ref(donkey)
+    del donkey
+    gc.collect()
+    assert donkey_ref() is None
+
+
+def test_adapter_is_reused_after_first_result_is_dropped():
+    donkey = Donkey()
+    first_ref = weakref.ref(as_transport(donkey))
+    gc.collect()
+    assert first_ref() is not None
+    assert as_transport(donkey) is first_ref()
+
+
+def test_registries_keep_separate_adapters():
+    class LoudSaddle(Saddle):
+        pass
+
+    registry = AdapterRegistry()
+    registry.register(Donkey, LoudSaddle)
+    donkey = Donkey()
+    assert type(registry.adapt(donkey)) is LoudSaddle
+    assert type(as_transport(donkey)) is Saddle
+
+
+def test_roads_accept_non_string_types():
+    from patterns.adapter import FrozenRoad, RoadBatch
+
+    assert ConcreteRoad(None).get_road_type() is None
+    assert FrozenRoad(7).get_road_type() == 7
+    assert RoadBatch([ConcreteRoad(None), ConcreteRoad("шоссе")]).road_types == (None, "шоссе")
+
+
+def test_drive_many_matches_drive():
+    roads = [ConcreteRoad("шоссе"), ConcreteRoad("проселочной дороге"), ConcreteRoad(None)]
+    for transport in (Car(), Saddle(Donkey())):
+        expected = [transport.drive(road) for road in roads]
+        log = transport.drive_many(roads)
+        assert log == expected
+        assert list(log) == expected
+        assert log[1:] == expected[1:]
+        assert log != expected[:-1]
+
+
+def test_dispatch_fleet_counts_consumed_segments():
+    from patterns.adapter import dispatch_fleet
+
+    lines = []
+    roads = [ConcreteRoad("шоссе")] * 3
+    logs, stats = dispatch_fleet([Car(), Saddle(Donkey())], roads, consume=lines.append)
+    assert stats["segments"] == len(lines) == 6
+    assert lines == list(logs[0]) + list(logs[1])
+    assert stats["segments_per_second"] > 0
+    assert dispatch_fleet([Car()], roads)[1]["segments_per_second"] is None
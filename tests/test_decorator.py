@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from patterns.decorator import (CourierDelivery, DeliveryManager, InsuranceDecorator, Order,
+                                WeekendDeliveryDecorator, iter_shipping_matrix_parallel,
+                                quote_orders_batch, top_shipping_options)
+
+
+def test_batch_insurance_uses_value_of_each_order():
+    system = WeekendDeliveryDecorator(InsuranceDecorator(CourierDelivery(), item_value=1000))
+    weights, distances, values = [1.0, 2.0], [100.0, 50.0], [500.0, 20000.0]
+
+    quote, = quote_orders_batch([system], weights, distances, values)
+
+    expected = [
+        WeekendDeliveryDecorator(InsuranceDecorator(CourierDelivery(), value))
+        .calculate_cost(weight, distance)
+        for weight, distance, value in zip(weights, distances, values)
+    ]
+    np.testing.assert_allclose(quote["cost"], expected)
+
+
+def test_batch_insurance_without_values_uses_item_value():
+    system = InsuranceDecorator(CourierDelivery(), item_value=1000)
+    order = Order([{"weight": 1.0}], 1000, 100)
+    cost = system.calculate_cost_batch([order.weight], [order.destination_distance])
+    np.testing.assert_allclose(cost, [order.calculate_shipping_options(system)["cost"]])
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_parallel_matrix_rejects_invalid_chunk_size_on_call(chunk_size):
+    with pytest.raises(ValueError):
+        iter_shipping_matrix_parallel([Order([{"weight": 1.0}], 100, 10)], chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("kwargs", [{"k": 0}, {"k": -1}, {"chunk_size": 0}])
+def test_top_shipping_options_rejects_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        top_shipping_options([Order([{"weight": 1.0}], 100, 10)], **kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [{"quote_cache_size": -1}, {"stack_cache_size": -1}])
+def test_delivery_manager_rejects_negative_cache_size(kwargs):
+    with pytest.raises(ValueError):
+        DeliveryManager(**kwargs)
+
+
+def test_delivery_manager_with_zero_cache_size_does_not_cache():
+    manager = DeliveryManager(quote_cache_size=0)
+    for _ in range(2):
+        assert manager.get_quote("courier", {"express": True}, 1.0, 10.0)["cost"] > 0
+    assert manager.get_cache_stats()["misses"] == 2
+
+
+def test_repeated_quote_is_served_from_cache():
+    manager = DeliveryManager()
+    first = manager.get_quote("courier", {"express": True}, 1, 10)
+    second = manager.get_quote("courier", {"express": True}, 1.0, 10.0)
+    assert second == first
+    stats = manager.get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_equivalent_options_share_one_key():
+    manager = DeliveryManager()
+    options = [
+        {"express": True},
+        {"express": 1, "weekend_delivery": False, "item_value": 500},
+        {"express": True, "insurance": False, "unknown": "x"},
+    ]
+    stacks = {id(manager.create_custom_delivery("courier", option)) for option in options}
+    for option in options:
+        manager.get_quote("courier", option, 1, 10)
+    stats = manager.get_cache_stats()
+    assert len(stacks) == 1
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 1)
+
+
+def test_quote_cache_evicts_least_recently_used():
+    manager = DeliveryManager(quote_cache_size=2)
+    manager.get_quote("courier", {}, 1, 10)
+    manager.get_quote("courier", {}, 2, 10)
+    manager.get_quote("courier", {}, 1, 10)  # Первый расчет становится самым свежим
+    manager.get_quote("courier", {}, 3, 10)  # Вытесняет вес 2
+
+    misses = manager.get_cache_stats()["misses"]
+    manager.get_quote("courier", {}, 1, 10)
+    assert manager.get_cache_stats()["misses"] == misses
+    manager.get_quote("courier", {}, 2, 10)
+    assert manager.get_cache_stats()["misses"] == misses + 1
+
+
+def test_delivery_stacks_are_bounded():
+    manager = DeliveryManager(stack_cache_size=4)
+    first = manager.create_custom_delivery("courier", {"insurance": True, "item_value": 0})
+    for value in range(1, 100):
+        manager.create_custom_delivery("courier", {"insurance": True, "item_value": value})
+    assert manager.get_cache_stats()["delivery_stacks"] == 4
+    assert manager.create_custom_delivery("courier", {"insurance": True, "item_value": 0}) is not first
+
+
+def test_concurrent_quotes_match_direct_calculation():
+    import threading
+
+    manager = DeliveryManager(quote_cache_size=8)
+    options = {"express": True, "weekend_delivery": True}
+    errors = []
+
+    def run():
+        for i in range(2000):
+            weight = i % 16
+            quote = manager.get_quote("courier", options, weight, 10)
+            expected = manager.create_custom_delivery("courier", options).calculate_cost(weight, 10)
+            if quote["cost"] != expected:
+                errors.append((weight, quote))
+
+    workers = [threading.Thread(target=run) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    stats = manager.get_cache_stats()
+    assert errors == []
+    assert stats["hits"] + stats["misses"] == 8 * 2000
+    assert stats["size"] <= 8
@@ -0,0 +1,71 @@
+import contextlib
+import io
+
+import pytest
+
+from patterns.facade import (SQLITE_MAX_INTEGER, SQLITE_MIN_INTEGER, OrderDatabase, SQLiteOrderDatabase,
+                             SQLiteUserDatabase, UserDatabase)
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return str(tmp_path / "shop.db")
+
+
+def _quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def test_sqlite_iter_users_includes_zero_and_negative_ids(sqlite_path):
+    user_db = SQLiteUserDatabase(sqlite_path)
+    with _quiet():
+        user_db.connect()
+        user_db._db.executemany("INSERT INTO users VALUES (?, ?, ?)",
+                                [(-5, "a", "a@mail.ru"), (0, "b", "b@mail.ru"), (3, "c", "c@mail.ru")])
+        for chunk_size in (1, 2, 1000):
+            assert [user["id"] for user in user_db.iter_users(chunk_size)] == [-5, 0, 3]
+        user_db.disconnect()
+
+
+
+def test_sqlite_iter_users_covers_full_integer_range(sqlite_path):
+    ids = [SQLITE_MIN_INTEGER, -1, 0, SQLITE_MAX_INTEGER]
+    user_db = SQLiteUserDatabase(sqlite_path)
+    with _quiet():
+        user_db.connect()
+        user_db._db.executemany("INSERT INTO users VALUES (?, ?, ?)",
+                                [(user_id, "u", "u@mail.ru") for user_id in ids])
+        for chunk_size in (1, 2, 4):
+            assert [user["id"] for user in user_db.iter_users(chunk_size)] == ids
+        user_db.disconnect()
+
+def test_sqlite_iter_orders_by_user_pages_all_rows(sqlite_path):
+    order_db = SQLiteOrderDatabase(sqlite_path)
+    with _quiet():
+        for i in range(7):
+            order_db.create_order(1 + i % 2, "Товар", 10.0)
+        ids = [order["id"] for order in order_db.iter_orders_by_user(1, chunk_size=2)]
+        assert ids == [order["id"] for order in order_db.get_orders_by_user(1)]
+        order_db.disconnect()
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_iterators_reject_invalid_chunk_size(sqlite_path, chunk_size):
+    with _quiet():
+        databases = [UserDatabase(), OrderDatabase(),
+                     SQLiteUserDatabase(sqlite_path), SQLiteOrderDatabase(sqlite_path)]
+        for database in databases:
+            iterate = database.iter_users if hasattr(database, "iter_users") else database.iter_orders
+            with pytest.raises(ValueError):
+                iterate(chunk_size)
+
+
+def test_sqlite_execute_query_binds_params(sqlite_path):
+    user_db = SQLiteUserDatabase(sqlite_path)
+    with _quiet():
+        user_db.connect()
+        user_db._db.executemany("INSERT INTO users VALUES (?, ?, ?)",
+                                [(1, "a", "a@mail.ru"), (2, "b'; --", "b@mail.ru")])
+        rows = user_db.execute_query("SELECT id FROM users WHERE name = ?", ("b'; --",))
+        user_db.disconnect()
+    assert rows == [{"id": 2}]
@@ -0,0 +1,40 @@
+import copy
+import pickle
+
+import pytest
+
+from patterns.adapter import FrozenRoad
+from patterns.cache import FrozenTree, FrozenTreeType
+from patterns.composite import FrozenProduct
+from patterns.decorator import FrozenOrder
+
+tree_type = FrozenTreeType("Дуб", "зеленый", "грубая")
+
+FROZEN_OBJECTS = [
+    (tree_type, ("name", "color", "texture")),
+    (FrozenTree(10, 20, 5, tree_type), ("x", "y", "size")),
+    (FrozenProduct("Телефон", 22700), ("name", "price")),
+    (FrozenRoad("шоссе"), ("get_road_type",)),
+    (FrozenOrder([{"name": "Телефон", "weight": 0.3}], 500, 80),
+     ("items", "total_value", "destination_distance", "weight")),
+]
+
+
+def _state(obj, attributes):
+    return [getattr(obj, name)() if name.startswith("get_") else getattr(obj, name)
+            for name in attributes]
+
+
+@pytest.mark.parametrize("obj, attributes", FROZEN_OBJECTS)
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))])
+def test_frozen_objects_can_be_copied_and_pickled(obj, attributes, clone):
+    restored = clone(obj)
+    assert type(restored) is type(obj)
+    assert _state(restored, attributes) == _state(obj, attributes)
+    with pytest.raises(AttributeError):
+        restored.extra = 1
+
+
+def test_frozen_tree_keeps_tree_type_state():
+    restored = pickle.loads(pickle.dumps(FrozenTree(1, 2, 3, tree_type)))
+    assert restored.tree_type.name == "Дуб"
@@ -0,0 +1,289 @@
+import threading
+
+from patterns.proxy import ImageCache, ImagePrefetcher
+
+
+class InstantImage:
+    """Изображение, которое загружается мгновенно"""
+    size_bytes = 0
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def display(self):
+        return self.filename
+
+
+def test_prefetch_with_instant_loader_does_not_deadlock():
+    def run():
+        for i in range(200):
+            prefetcher = ImagePrefetcher(cache=ImageCache(), loader=InstantImage)
+            futures = prefetcher.prefetch([f"{i}-a.jpg", f"{i}-b.jpg"])
+            for future in futures.values():
+                future.result(timeout=5)
+            prefetcher.shutdown()
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(timeout=30)
+    assert not worker.is_alive()
+
+
+def test_prefetch_forgets_finished_loads():
+    cache = ImageCache()
+    prefetcher = ImagePrefetcher(cache=cache, loader=InstantImage)
+    for future in prefetcher.prefetch(["a.jpg"]).values():
+        future.result(timeout=5)
+    prefetcher.shutdown()
+    assert cache.contains("a.jpg")
+    assert prefetcher._pending == {}
+
+
+def test_cached_display_hits_cache_and_audits_every_view(tmp_path):
+    from patterns.proxy import AccessAuditLog, ImageProxy
+
+    cache = ImageCache()
+    audit_log = AccessAuditLog(str(tmp_path / "access.log"), batch_size=2)
+    proxy = ImageProxy("a.jpg", "Admin", cache=cache, loader=InstantImage, audit_log=audit_log)
+    assert [proxy.display() for _ in range(3)] == ["a.jpg"] * 3
+    audit_log.close()
+
+    assert cache.get_stats()["misses"] == 1
+    assert cache.get_stats()["hits"] == 2
+    lines = (tmp_path / "access.log").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert all(line.endswith("[ACCESS] Admin -> a.jpg") for line in lines)
+
+
+def test_proxies_do_not_pin_evicted_images(tmp_path):
+    import gc
+    import weakref
+
+    from patterns.proxy import AccessAuditLog, ImageProxy
+
+    loaded = []
+
+    class SizedImage(InstantImage):
+        size_bytes = 100
+
+        def __init__(self, filename):
+            super().__init__(filename)
+            loaded.append(weakref.ref(self))
+
+    cache = ImageCache(max_items=None, max_bytes=150)
+    audit_log = AccessAuditLog(str(tmp_path / "access.log"))
+    proxies = [ImageProxy(f"{i}.jpg", cache=cache, loader=SizedImage, audit_log=audit_log)
+               for i in range(5)]
+    for proxy in proxies:
+        proxy.display()
+    gc.collect()
+    audit_log.close()
+
+    assert cache.get_stats()["evictions"] == 4
+    assert [image() is not None for image in loaded] == [False] * 4 + [True]
+
+
+def test_guest_cannot_display():
+    import pytest
+
+    from patterns.proxy import ImageProxy
+
+    with pytest.raises(PermissionError):
+        ImageProxy("a.jpg", "Guest", cache=ImageCache(), loader=InstantImage).display()
+
+
+def test_audit_log_writes_partial_batch_at_exit(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    log_path = tmp_path / "access.log"
+    script = (
+        "from patterns.proxy import AccessAuditLog\n"
+        f"log = AccessAuditLog({str(log_path)!r}, batch_size=1000)\n"
+        "for _ in range(10):\n"
+        "    log.record('User', 'a.jpg')\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 10
+
+
+def test_audit_log_does_not_lose_concurrent_events(tmp_path):
+    from patterns.proxy import AccessAuditLog
+
+    audit_log = AccessAuditLog(str(tmp_path / "access.log"), batch_size=50)
+
+    def run():
+        for _ in range(20000):
+            audit_log.record("User", "a.jpg")
+
+    import sys
+
+    # Частое переключение потоков, чтобы гонка с flush() проявлялась надежно
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        workers = [threading.Thread(target=run) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        sys.setswitchinterval(interval)
+    audit_log.close()
+
+    assert len((tmp_path / "access.log").read_text(encoding="utf-8").splitlines()) == 160000
+
+
+def test_concurrent_get_or_load_runs_loader_once():
+    cache = ImageCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_loader(filename):
+        calls.append(filename)
+        started.set()
+        release.wait(timeout=5)
+        return InstantImage(filename)
+
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(cache.get_or_load("a.jpg", slow_loader)))
+               for _ in range(8)]
+    workers[0].start()
+    started.wait(timeout=5)
+    for worker in workers[1:]:
+        worker.start()
+    # Остальные потоки должны встать в ожидание до окончания загрузки
+    import time
+
+    deadline = time.monotonic() + 5
+    while cache.get_stats()["shared_loads"] < 7 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for worker in workers:
+        worker.join(timeout=5)
+
+    assert calls == ["a.jpg"]
+    assert len(results) == 8 and all(image is results[0] for image in results)
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["shared_loads"], stats["hits"]) == (1, 7, 0)
+
+
+def test_failed_load_is_not_cached_and_can_be_retried():
+    import pytest
+
+    cache = ImageCache()
+
+    def broken_loader(filename):
+        raise OSError(filename)
+
+    with pytest.raises(OSError):
+        cache.get_or_load("a.jpg", broken_loader)
+    assert not cache.contains("a.jpg")
+    assert cache.get_or_load("a.jpg", InstantImage).display() == "a.jpg"
+
+
+def test_cache_evicts_least_recently_used_by_count():
+    cache = ImageCache(max_items=2)
+    cache.get_or_load("a.jpg", InstantImage)
+    cache.get_or_load("b.jpg", InstantImage)
+    cache.get_or_load("a.jpg", InstantImage)  # a становится самым свежим
+    cache.get_or_load("c.jpg", InstantImage)  # вытесняет b
+
+    assert [cache.contains(name) for name in ("a.jpg", "b.jpg", "c.jpg")] == [True, False, True]
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_cache_evicts_by_bytes_but_keeps_newest_image():
+    class SizedImage(InstantImage):
+        def __init__(self, filename):
+            super().__init__(filename)
+            self.size_bytes = int(filename.split(".")[0])
+
+    cache = ImageCache(max_items=None, max_bytes=100)
+    cache.get_or_load("40.img", SizedImage)
+    cache.get_or_load("50.img", SizedImage)
+    assert cache.get_stats()["bytes"] == 90
+
+    cache.get_or_load("30.img", SizedImage)  # 120 байт: вытесняется 40.img
+    assert not cache.contains("40.img")
+    assert cache.get_stats()["bytes"] == 80
+
+    cache.get_or_load("500.img", SizedImage)  # Больше лимита, но самое новое остается
+    stats = cache.get_stats()
+    assert cache.contains("500.img")
+    assert (stats["items"], stats["bytes"], stats["evictions"]) == (1, 500, 3)
+
+
+def test_cache_stats_count_hits_misses_and_load_time():
+    cache = ImageCache()
+    assert cache.get_stats()["hit_rate"] == 0.0
+    cache.get_or_load("a.jpg", InstantImage)
+    cache.get_or_load("a.jpg", InstantImage)
+    cache.get_or_load("a.jpg", InstantImage)
+    assert cache.get("missing.jpg") is None
+    cache.get_or_load("b.jpg", InstantImage)
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["shared_loads"]) == (2, 2, 0)
+    assert stats["hit_rate"] == 0.5
+    assert stats["items"] == 2
+    assert stats["total_load_time"] >= 0.0
+    assert stats["average_load_time"] == stats["total_load_time"] / 2
+
+
+def _write_image(path, data):
+    from patterns.proxy import MappedHighResolutionImage
+
+    path.write_bytes(data)
+    return MappedHighResolutionImage(str(path))
+
+
+def test_mapped_image_header_and_tiles(tmp_path):
+    import pytest
+
+    data = bytes(range(256)) * 4
+    image = _write_image(tmp_path / "a.img", data)
+    header, tile, last = image.header(), image.tile(1, 300), image.tile(3, 300)
+
+    assert image.size_bytes == 1024
+    assert bytes(header) == data[:64]
+    assert bytes(tile) == data[300:600]
+    assert bytes(last) == data[900:]
+    assert image.tile_count(300) == 4
+    with pytest.raises(IndexError):
+        image.tile(4, 300)
+    with pytest.raises(IndexError):
+        image.tile(-1, 300)
+
+    for view in (header, tile, last):
+        view.release()
+    image.close()
+
+
+def test_mapped_image_handles_empty_file(tmp_path):
+    import pytest
+
+    image = _write_image(tmp_path / "empty.img", b"")
+    assert image.size_bytes == 0
+    assert bytes(image.header()) == b""
+    assert image.tile_count(256) == 0
+    with pytest.raises(IndexError):
+        image.tile(0, 256)
+    image.close()
+
+
+def test_mapped_image_failed_close_keeps_image_usable(tmp_path):
+    import pytest
+
+    image = _write_image(tmp_path / "a.img", b"x" * 128)
+    header = image.header(4)
+    with pytest.raises(BufferError):
+        image.close()
+
+    assert bytes(image.tile(1, 64)) == b"x" * 64
+    header.release()
+    image.close()
+    image.close()  # Повторное закрытие ничего не делает